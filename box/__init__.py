@@ -9,6 +9,7 @@ from box.box_list import BoxList
 from box.config_box import ConfigBox
 from box.exceptions import BoxError, BoxKeyError
 from box.from_file import box_from_file, box_from_string
+from box.shared_frozen_box import SharedFrozenBox
 from box.shorthand_box import SBox, DDBox
 import box.converters
 
@@ -21,4 +22,5 @@ __all__ = [
     "box_from_file",
     "SBox",
     "DDBox",
+    "SharedFrozenBox",
 ]
@@ -8,12 +8,19 @@ Improved dictionary access through dot notation with additional tools.
 from __future__ import annotations
 
 import copy
+import itertools
 import re
+import sys
 import warnings
+import weakref
 from collections.abc import Callable, Generator, Iterable, Mapping
+from functools import lru_cache
+from hashlib import blake2b
 from inspect import signature
 from keyword import iskeyword
+from operator import itemgetter
 from os import PathLike
+from types import MappingProxyType
 from typing import Any, Literal
 
 
@@ -38,28 +45,72 @@ from box.converters import (
 )
 from box.exceptions import BoxError, BoxKeyError, BoxTypeError, BoxValueError, BoxWarning
 
-__all__ = ["Box"]
+__all__ = ["Box", "BoxPath"]
 
 _first_cap_re = re.compile("(.)([A-Z][a-z]+)")
 _all_cap_re = re.compile("([a-z0-9])([A-Z])")
 _list_pos_re = re.compile(r"\[(\d+)\]")
+_box_path_re = re.compile(r"(?:[^.\[\]]+|\[\d+\])(?:\.[^.\[\]]+|\[\d+\])*")
+_box_path_segment_re = re.compile(r"\[(\d+)\]|([^.\[\]]+)")
 
 # a sentinel object for indicating no default, in order to allow users
 # to pass `None` as a valid default value
 NO_DEFAULT = object()
 # a sentinel object for indicating when to skip adding a new namespace, allowing `None` keys
 NO_NAMESPACE = object()
+# a sentinel object for a dotted path that could not be resolved without falling back to the full lookup
+NO_PATH_MATCH = object()
 
 
-def _is_ipython():
+@lru_cache(maxsize=1)
+def _ipython_getter() -> Callable | None:
+    # The import is only attempted once, not on every missing "getdoc" or "shape" lookup
     try:
         from IPython import get_ipython
     except ImportError:
-        ipython = False
+        return None
+    return get_ipython
+
+
+def _is_ipython():
+    get_ipython = _ipython_getter()
+    return True if get_ipython is not None and get_ipython() else False
+
+
+# Calling conventions of callable default_box_attr values, held weakly so a remembered callable is
+# never kept alive. Bound methods are remembered by their function, so they hold no instance either.
+_default_box_attr_conventions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_default_box_attr_method_conventions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _default_box_attr_arguments(default_value: Callable) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """The positional and keyword arguments a callable default_box_attr takes, only inspected once per callable"""
+    function = getattr(default_value, "__func__", None)
+    if function is not None:
+        conventions, key = _default_box_attr_method_conventions, function
     else:
-        ipython = True if get_ipython() else False
+        conventions, key = _default_box_attr_conventions, default_value
+    try:
+        return conventions[key]
+    except (KeyError, TypeError):
+        # TypeError for callables that cannot be weakly referenced or hashed, those are inspected every time
+        pass
+    arguments = _inspect_default_box_attr(default_value)
+    try:
+        conventions[key] = arguments
+    except TypeError:
+        pass
+    return arguments
+
 
-    return ipython
+def _inspect_default_box_attr(default_value: Callable) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    parameters = signature(default_value).parameters.values()
+    positional = tuple(p.name for p in parameters if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+    for name in positional:
+        if name not in ("key", "box_instance"):
+            raise BoxError("default_box_attr can only have the arguments 'key' and 'box_instance'")
+    keywords = tuple(p.name for p in parameters if p.kind is p.KEYWORD_ONLY and p.name in ("key", "box_instance"))
+    return positional, keywords
 
 
 def _exception_cause(e):
@@ -72,11 +123,14 @@ def _exception_cause(e):
     return e.__cause__ if isinstance(e, (BoxKeyError, BoxValueError)) else e
 
 
+@lru_cache(maxsize=8192, typed=True)
 def _camel_killer(attr):
     """
     CamelKiller, qu'est-ce que c'est?
 
     Taken from http://stackoverflow.com/a/1176023/3244542
+
+    Remembered per process, as the same keys are looked up over and over again.
     """
     attr = str(attr)
 
@@ -85,6 +139,51 @@ def _camel_killer(attr):
     return re.sub(" *_+", "_", s2.lower())
 
 
+@lru_cache(maxsize=8192, typed=True)
+def _safe_name(attr, camel_killer: bool, prefix: str) -> str:
+    """Convert a key into an attribute name, remembered per process as the same keys are loaded again and again"""
+    if isinstance(attr, tuple):
+        attr = "_".join([str(x) for x in attr])
+
+    attr = attr.decode("utf-8", "ignore") if isinstance(attr, bytes) else str(attr)
+    if camel_killer:
+        attr = _camel_killer(attr)
+
+    if attr.isidentifier() and not iskeyword(attr):
+        return attr
+
+    if sum(1 for character in attr if character.isidentifier() and not iskeyword(character)) == 0:
+        attr = f"{prefix}{attr}"
+        if attr.isidentifier() and not iskeyword(attr):
+            return attr
+
+    out = []
+    last_safe = 0
+    for i, character in enumerate(attr):
+        if f"x{character}".isidentifier():
+            last_safe = i
+            out.append(character)
+        elif not out:
+            continue
+        else:
+            if last_safe == i - 1:
+                out.append("_")
+
+    safe = "".join(out)[: last_safe + 1]
+
+    try:
+        int(safe[0])
+    except (ValueError, IndexError):
+        pass
+    else:
+        safe = f"{prefix}{safe}"
+
+    if iskeyword(safe):
+        safe = f"{prefix}{safe}"
+
+    return safe
+
+
 def _recursive_tuples(iterable, box_class, recreate_tuples=False, **kwargs):
     out_list = []
     for i in iterable:
@@ -108,6 +207,101 @@ def _parse_box_dots(bx, item, setting=False):
     raise BoxError("Could not split box dots properly")
 
 
+class BoxPath:
+    """
+    A box_dots style path, such as "a.b[3].c", parsed once so it can be resolved against
+    any Box, BoxList or plain nested dictionaries and lists in a tight loop.
+
+    Paths are resolved the same way as with `box_dots=True`: a key containing dots is
+    preferred over splitting it. When the fast walk cannot match the path, such as missing
+    keys with `default_box` or `camel_killer_box` conversions, the regular lookup is used.
+
+    :param path: dotted path to parse
+    """
+
+    __slots__ = ("path", "segments", "remainders")
+
+    def __init__(self, path: str):
+        if not isinstance(path, str) or not _box_path_re.fullmatch(path):
+            raise BoxValueError(f'"{path}" is not a valid box_dots path')
+        self.path = path
+        segments = []
+        remainders = []
+        for match in _box_path_segment_re.finditer(path):
+            index, key = match.groups()
+            segments.append(key if key is not None else int(index))
+            remainders.append(path[match.start() :])
+        self.segments = tuple(segments)
+        # What is left of the path at each segment, as Box tries that as a single key before splitting it
+        self.remainders = tuple(remainders)
+
+    def _resolve(self, obj, literal_first: bool = True, parent_only: bool = False, box_dots_only: bool = True):
+        """
+        Walk the path without raising, returning NO_PATH_MATCH if the regular lookup is needed.
+
+        :param literal_first: return a key matching the rest of the path, as lookups do but setting does not
+        :param parent_only: stop before the last segment
+        :param box_dots_only: only follow segments that the nested Box or BoxList would split with box_dots
+        """
+        node = obj
+        last = len(self.segments) - 1 if parent_only else len(self.segments)
+        for index in range(last):
+            segment = self.segments[index]
+            if isinstance(node, Box):
+                if index:
+                    remainder = self.remainders[index]
+                    if literal_first and dict.__contains__(node, remainder):
+                        return dict.__getitem__(node, remainder)
+                    if (
+                        box_dots_only
+                        and index < len(self.segments) - 1
+                        and not node._Box__process_dotted_key(remainder)
+                    ):
+                        return NO_PATH_MATCH
+                if not isinstance(segment, str) or not dict.__contains__(node, segment):
+                    return NO_PATH_MATCH
+                node = dict.__getitem__(node, segment)
+            elif isinstance(node, box.BoxList):
+                if not isinstance(segment, int) or segment >= len(node):
+                    return NO_PATH_MATCH
+                if box_dots_only and not node.box_options.get("box_dots"):
+                    return NO_PATH_MATCH
+                node = list.__getitem__(node, segment)
+            elif not box_dots_only and isinstance(node, dict) and isinstance(segment, str) and segment in node:
+                node = node[segment]
+            elif not box_dots_only and isinstance(node, list) and isinstance(segment, int) and segment < len(node):
+                node = node[segment]
+            else:
+                return NO_PATH_MATCH
+        return node
+
+    def __call__(self, obj):
+        value = self._resolve(obj, box_dots_only=False)
+        if value is NO_PATH_MATCH:
+            return obj[self.path]
+        return value
+
+    def get(self, obj, default=None):
+        value = self._resolve(obj, box_dots_only=False)
+        if value is NO_PATH_MATCH:
+            try:
+                return obj[self.path]
+            except (KeyError, IndexError, TypeError):
+                return default
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r})"
+
+
+@lru_cache(maxsize=4096)
+def _cached_box_path(item: str) -> BoxPath | None:
+    try:
+        return BoxPath(item)
+    except BoxValueError:
+        return None
+
+
 def _get_dot_paths(bx, current=""):
     """A generator of all the end node keys in a box in box_dots format"""
 
@@ -130,28 +324,736 @@ def _get_dot_paths(bx, current=""):
     yield from handle_dicts(bx, current)
 
 
+class _DottedIndex:
+    """Every end node under a Box or BoxList by its box_dots path, relative to that node"""
+
+    __slots__ = ("entries", "children", "sorted_keys")
+
+    def __init__(self, entries: dict, children: list):
+        self.entries = entries
+        # (nested Box or BoxList, its index) for every container the entries were built from
+        self.children = children
+        self.sorted_keys: list | None = None
+
+
+def _dotted_index(node, checked: dict | None = None) -> _DottedIndex:
+    """
+    Return the dotted path index of a Box or BoxList, only rebuilding what changed.
+
+    Each node keeps its own index, which is dropped whenever that node itself is changed.
+    An index is still valid if none of the nested indexes it was built from were rebuilt since,
+    so after a change only the indexes of that node and its parents are rebuilt.
+    """
+    if checked is None:
+        checked = {}
+    elif id(node) in checked:
+        return checked[id(node)]
+    is_box = isinstance(node, Box)
+    index = node._box_config.get("__dotted_index") if is_box else node._dotted_index
+    if index is not None:
+        for child, child_index in index.children:
+            if _dotted_index(child, checked) is not child_index:
+                index = None
+                break
+    if index is None:
+        entries: dict = {}
+        children = []
+        for key, value in dict.items(node) if is_box else enumerate(node):
+            if is_box:
+                if not isinstance(key, str):
+                    continue
+                path = key
+            else:
+                path = f"[{key}]"
+            if isinstance(value, (Box, box.BoxList)):
+                child_index = _dotted_index(value, checked)
+                children.append((value, child_index))
+                if child_index.entries:
+                    separator = "." if isinstance(value, Box) else ""
+                    for sub_path, sub_value in child_index.entries.items():
+                        # A key holding the whole path is found first by lookups, so it wins
+                        entries.setdefault(f"{path}{separator}{sub_path}", sub_value)
+                    continue
+            entries[path] = value
+        index = _DottedIndex(entries, children)
+        if is_box:
+            node._box_config["__dotted_index"] = index
+        else:
+            node._dotted_index = index
+    checked[id(node)] = index
+    return index
+
+
+def _walk(root, order: str = "pre", leaves_only: bool = False, max_depth: int | None = None, dotted: bool = False):
+    """
+    Validate the walk options and return the generator, so mistakes are raised where walk is called.
+    """
+    if order not in ("pre", "post"):
+        raise BoxValueError(f'walk order must be "pre" or "post", not "{order}"')
+    if max_depth is not None and max_depth < 1:
+        raise BoxValueError("walk max_depth must be at least 1")
+    return _walk_tree(root, order == "post", leaves_only, max_depth, dotted)
+
+
+def _walk_children(container):
+    return iter(dict.items(container)) if isinstance(container, dict) else enumerate(container)
+
+
+def _walk_tree(
+    root, post: bool, leaves_only: bool, max_depth: int | None, dotted: bool, sep: str = ".", brackets: bool = True
+):
+    # An explicit stack of (path, container, children iterator), so deep trees never hit the recursion limit
+    stack: list = [((), "", root, _walk_children(root))]
+    # Containers on the current path, a recursive reference is yielded like a leaf instead of walked again
+    active = {id(root)}
+    while stack:
+        path, name, container, children = stack[-1]
+        in_list = not isinstance(container, dict)
+        for key, value in children:
+            child_path = (*path, key)
+            if dotted:
+                if in_list and brackets:
+                    child_name = f"{name}[{key}]"
+                else:
+                    child_name = f"{name}{sep}{key}" if name else f"{key}"
+            else:
+                child_name = ""
+            if (
+                value
+                # Frozen boxes hold their lists as tuples, tuple subclasses such as namedtuples are values
+                and (isinstance(value, (dict, list)) or type(value) is tuple)
+                and id(value) not in active
+                and (max_depth is None or len(child_path) < max_depth)
+            ):
+                if not post and not leaves_only:
+                    yield child_name if dotted else child_path, value
+                active.add(id(value))
+                stack.append((child_path, child_name, value, _walk_children(value)))
+                break
+            yield child_name if dotted else child_path, value
+        else:
+            stack.pop()
+            active.discard(id(container))
+            if post and not leaves_only and stack:
+                yield name if dotted else path, container
+
+
+_flat_list_styles = ("[i]", "i")
+_flat_part_re = re.compile(r"(.*?)((?:\[\d+\])*)")
+# Marks positions not set by any path yet, so a path set to None is still seen as set
+_unset = object()
+
+
+def _unflatten(mapping: Mapping, sep: str, list_style: str, root: Box | None = None) -> dict:
+    """
+    Build nested containers from a flat mapping of paths, in one pass over the keys.
+
+    Without a root, plain dictionaries and lists are built. With an empty Box as root, nested Box and
+    BoxList objects are created directly with its config, so nothing has to be converted afterwards.
+    """
+    if root is None:
+        root = {}  # type: ignore[assignment]
+        make: dict = {dict: lambda parent, key: {}, list: lambda parent, key: []}
+    else:
+        config = root._Box__box_config()  # type: ignore[attr-defined]
+        box_class = config["box_class"]
+
+        def namespace(parent, key):
+            if isinstance(parent, Box):
+                return _child_namespace(parent._box_config["box_namespace"], key)
+            return parent.box_options["box_namespace"]
+
+        def new_box(parent, key):
+            child = dict.__new__(box_class)
+            object.__setattr__(child, "_box_config", _get_box_config())
+            child._box_config.update(config)
+            child._box_config["box_namespace"] = namespace(parent, key)
+            child._box_config["__created"] = True
+            return child
+
+        def new_box_list(parent, key):
+            return box.BoxList(**{**config, "box_namespace": namespace(parent, key)})
+
+        make = {dict: new_box, list: new_box_list}
+
+    # Lists with positions skipped over, those are filled with None once every path is set
+    padded: list = []
+    for path, value in mapping.items():
+        segments: list = []
+        for part in str(path).split(sep):
+            if list_style == "i":
+                segments.append(int(part) if part.isdigit() and segments else part)
+                continue
+            if "[" not in part:
+                segments.append(part)
+                continue
+            name, positions = _flat_part_re.fullmatch(part).groups()  # type: ignore[union-attr]
+            if name or not positions or not segments:
+                segments.append(name)
+            if positions:
+                segments.extend(int(pos) for pos in positions[1:-1].split("]["))
+        node = root
+        for index, segment in enumerate(segments):
+            if isinstance(node, list):
+                if len(node) <= segment:
+                    if len(node) < segment:
+                        padded.append(node)
+                    list.extend(node, [_unset] * (segment - len(node) + 1))
+                child = list.__getitem__(node, segment)
+            else:
+                child = dict.get(node, segment, _unset)
+            if index == len(segments) - 1:
+                if child is not _unset:
+                    raise BoxError(f'"{path}" sets a value that is already set by another path')
+                # Values go through the regular conversion, only the containers made here skip it
+                if isinstance(node, Box):
+                    node._Box__convert_and_store(segment, value)  # type: ignore[attr-defined]
+                elif isinstance(node, box.BoxList):
+                    list.__setitem__(node, segment, node._convert(value))
+                else:
+                    node[segment] = value
+                break
+            container_type = list if isinstance(segments[index + 1], int) else dict
+            if child is _unset:
+                child = make[container_type](node, segment)
+                if isinstance(node, list):
+                    list.__setitem__(node, segment, child)
+                else:
+                    if isinstance(node, Box) and node._box_config["__safe_keys"] is not None:
+                        node._box_config["__safe_keys"][node._safe_attr(segment)] = segment
+                    dict.__setitem__(node, segment, child)
+            elif not isinstance(child, container_type):
+                raise BoxError(f'"{path}" goes through a value that is already set by another path')
+            node = child
+    for node in padded:
+        for position, item in enumerate(list.__iter__(node)):
+            if item is _unset:
+                list.__setitem__(node, position, None)
+    return root  # type: ignore[return-value]
+
+
+def _set_in(node, segments: tuple, remainders: tuple, value, fresh: set, config: dict | None = None):
+    """
+    Return a copy of the frozen node with the value set at the path, sharing everything off the path.
+
+    :param remainders: the rest of the path at each segment, tried as a key first like box_dots lookups
+    :param fresh: ids of boxes copied by this update, which are changed in place instead of copied again
+    :param config: config for converting values stored into a tuple, from the Box holding it
+    """
+    key = segments[0]
+    if isinstance(node, Box):
+        if len(segments) > 1 and remainders and dict.__contains__(node, remainders[0]):
+            key, segments = remainders[0], (remainders[0],)
+        if id(node) not in fresh:
+            copied = dict.__new__(type(node))
+            object.__setattr__(copied, "_box_config", _get_box_config())
+            copied._box_config.update((k, v) for k, v in node._box_config.items() if not k.startswith("__"))
+            copied._box_config["__created"] = True
+            for k, v in dict.items(node):
+                dict.__setitem__(copied, k, v)
+            fresh.add(id(copied))
+            node = copied
+        if len(segments) == 1:
+            node._Box__convert_and_store(key, value)
+            return node
+        child = dict.get(node, key, NO_DEFAULT)
+        if child is NO_DEFAULT:
+            # Missing keys are created as nested boxes, as long as no list position is needed
+            for segment in reversed(segments[1:]):
+                if not isinstance(segment, str):
+                    raise BoxKeyError(f'"{key}" does not exist to set [{segment}] in')
+                value = {segment: value}
+            node._Box__convert_and_store(key, value)
+            return node
+        node._Box__changed()
+        child_config = node._Box__box_config(extra_namespace=key)
+        dict.__setitem__(node, key, _set_in(child, segments[1:], remainders[1:], value, fresh, child_config))
+        return node
+    if type(node) is tuple and isinstance(key, int) and config is not None:
+        if not -len(node) <= key < len(node):
+            raise BoxKeyError(f"[{key}] is out of range for a tuple of {len(node)} items")
+        if len(segments) == 1:
+            value = _recursive_tuples((value,), recreate_tuples=config["modify_tuples_box"], **config)[0]
+        else:
+            value = _set_in(node[key], segments[1:], remainders[1:], value, fresh, config)
+        items = list(node)
+        items[key] = value
+        return tuple(items)
+    if isinstance(node, box.BoxList) and isinstance(key, int):
+        if not -len(node) <= key < len(node):
+            raise BoxKeyError(f"[{key}] is out of range for a BoxList of {len(node)} items")
+        if id(node) not in fresh:
+            # Copied with the same options, so a frozen BoxList stays frozen
+            copied = type(node).__new__(type(node))
+            copied.box_options = dict(node.box_options)
+            list.extend(copied, list.__iter__(node))
+            fresh.add(id(copied))
+            node = copied
+        if len(segments) == 1:
+            value = node._convert(value)
+        else:
+            value = _set_in(list.__getitem__(node, key), segments[1:], remainders[1:], value, fresh, node.box_options)
+        node._changed()
+        list.__setitem__(node, key, value)
+        return node
+    raise BoxTypeError(
+        f"Cannot set [{key}] within {type(node).__name__}, only frozen Boxes and their BoxLists and tuples"
+    )
+
+
+def _to_native(root, views: bool = False):
+    """
+    Copy a tree of Box and BoxList objects into native dictionaries and lists with an explicit stack,
+    so any depth is safe. Every node is only copied once, so shared and recursive references are
+    kept as the same native object.
+
+    :param views: return nested boxes holding no other Box or BoxList as read only views of them,
+        except with default_box, where reading a missing key through the view would add it to the Box
+    """
+    memo: dict[int, Any] = {}
+    stack: list[tuple] = []
+
+    def start(node, nested=True):
+        if isinstance(node, Box):
+            if (
+                views
+                and nested
+                and not node._box_config["default_box"]
+                and not any(isinstance(v, (Box, box.BoxList)) for v in dict.values(node))
+            ):
+                out: Any = MappingProxyType(node)
+            else:
+                out = {}
+                stack.append((node, out))
+        else:
+            out = []
+            stack.append((node, out))
+        memo[id(node)] = out
+        return out
+
+    result = start(root, nested=False)
+    while stack:
+        node, out = stack.pop()
+        if isinstance(node, Box):
+            for k, v in dict.items(node):
+                if isinstance(v, (Box, box.BoxList)):
+                    v = memo[id(v)] if id(v) in memo else start(v)
+                out[k] = v
+        else:
+            for v in list.__iter__(node):
+                if isinstance(v, (Box, box.BoxList)):
+                    v = memo[id(v)] if id(v) in memo else start(v)
+                out.append(v)
+    return result
+
+
+def _fingerprint(value, active=None) -> bytes:
+    """
+    BLAKE2 digest of a canonical encoding of the value, the same in every process.
+    Dictionaries are unordered, lists and tuples are the same sequence, and the digests of
+    frozen Box and BoxList nodes are cached on them.
+    """
+    if isinstance(value, Box):
+        cached = value._box_config.get("__fingerprint")
+    elif isinstance(value, box.BoxList):
+        cached = value._cached_fingerprint
+    else:
+        cached = None
+    if cached is not None:
+        return cached
+    if value is None:
+        data = b"N"
+    elif isinstance(value, bool):
+        data = b"T" if value else b"F"
+    elif isinstance(value, int):
+        data = b"I" + str(value).encode()
+    elif isinstance(value, float):
+        data = b"R" + value.hex().encode()
+    elif isinstance(value, complex):
+        data = b"C" + value.real.hex().encode() + b"," + value.imag.hex().encode()
+    elif isinstance(value, str):
+        data = b"S" + value.encode("utf-8", "surrogatepass")
+    elif isinstance(value, (bytes, bytearray)):
+        data = b"B" + bytes(value)
+    elif isinstance(value, (dict, list, tuple, set, frozenset)):
+        active = set() if active is None else active
+        if id(value) in active:
+            raise BoxError("Cannot fingerprint recursive structures")
+        active.add(id(value))
+        if isinstance(value, dict):
+            parts = sorted(_fingerprint(k, active) + _fingerprint(v, active) for k, v in dict.items(value))
+            data = b"D" + b"".join(parts)
+        elif isinstance(value, (set, frozenset)):
+            data = b"E" + b"".join(sorted(_fingerprint(item, active) for item in value))
+        else:
+            data = b"L" + b"".join(_fingerprint(item, active) for item in value)
+        active.discard(id(value))
+    else:
+        raise BoxTypeError(f"Cannot fingerprint values of type {type(value).__name__}")
+    digest = blake2b(data, digest_size=16).digest()
+    if isinstance(value, Box) and value._box_config["frozen_box"]:
+        value._box_config["__fingerprint"] = digest
+    elif isinstance(value, box.BoxList) and value.box_options.get("frozen_box"):
+        value._cached_fingerprint = digest
+    return digest
+
+
+def _intern_tree(root) -> dict[str, int]:
+    """
+    Make structurally equal boxes, BoxLists and tuples in the tree one shared object, and intern every
+    string key and value, so repeated fragments are only kept in memory once. Nodes are only shared
+    when their items are in the same order and their configs match apart from the namespace,
+    where the first one found is kept. Values that are not hashable keep their nodes from being shared.
+    """
+    report = {"nodes": 0, "strings": 0, "bytes_saved": 0}
+    # Structure of every node seen to the node kept for it, children are in it by id as they are already shared
+    canonical: dict[tuple, Any] = {}
+    # id of every visited node to its (shared node, structure), the structure is None if it cannot be shared
+    done: dict[int, tuple] = {}
+    configs: list[dict] = []
+
+    def config_index(config: dict) -> int:
+        shared = {k: v for k, v in config.items() if k not in _node_config_keys}
+        for index, known in enumerate(configs):
+            if known == shared:
+                return index
+        configs.append(shared)
+        return len(configs) - 1
+
+    def visit(value) -> tuple:
+        if type(value) is str:
+            interned = sys.intern(value)
+            if interned is not value:
+                report["strings"] += 1
+                report["bytes_saved"] += sys.getsizeof(value)
+            return interned, (str, interned)
+        if not isinstance(value, (Box, box.BoxList)) and type(value) is not tuple:
+            try:
+                hash(value)
+            except TypeError:
+                return value, None
+            return value, (type(value), value)
+        if id(value) in done:
+            return done[id(value)]
+        done[id(value)] = (value, None)
+        node = value
+        if isinstance(node, Box):
+            items = [(visit(k), visit(v)) for k, v in dict.items(node)]
+            if any(new_k is not k for ((new_k, _), _), k in zip(items, dict.keys(node))):
+                dict.clear(node)
+            for (new_k, _), (new_v, _) in items:
+                if dict.get(node, new_k, NO_DEFAULT) is not new_v:
+                    dict.__setitem__(node, new_k, new_v)
+            structure = tuple(part for pair in items for _, part in pair)
+            config = config_index(node._box_config)
+            size = sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(node._box_config)
+        else:
+            items = [visit(item) for item in node]
+            structure = tuple(part for _, part in items)
+            if isinstance(node, box.BoxList):
+                for index, (new_item, _) in enumerate(items):
+                    if new_item is not node[index]:
+                        list.__setitem__(node, index, new_item)
+                config = config_index(node.box_options)
+                size = sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+            else:
+                if any(new_item is not item for (new_item, _), item in zip(items, node)):
+                    node = tuple(new_item for new_item, _ in items)
+                config = -1
+                size = sys.getsizeof(node)
+        if None in structure:
+            result: tuple = (node, None)
+        else:
+            shared = canonical.setdefault((type(node), config, structure), node)
+            if shared is not node:
+                report["nodes"] += 1
+                report["bytes_saved"] += size
+            result = (shared, ("node", id(shared)))
+        done[id(value)] = result
+        return result
+
+    visit(root)
+    return report
+
+
+# Every change to a Box or BoxList takes the next number, kept as the version of the changed node,
+# and the last number taken is kept here, so it is quick to tell that nothing changed anywhere at all
+_versions = itertools.count(1)
+_last_version = [0]
+
+
+def _tree_version(root) -> int:
+    """
+    Highest version of any Box or BoxList in the tree. Any change made through them, including adding
+    or removing nested parts, gives a higher number, so it can tell if anything worked out from
+    the tree is out of date.
+    """
+    if isinstance(root, Box) and root._box_config.get("box_track_changes"):
+        # Every change below has already been passed up to it
+        return root._box_config["__version"]
+    if isinstance(root, box.BoxList) and root.box_options.get("box_track_changes"):
+        return root._version
+    version = 0
+    seen = {id(root)}
+    stack = [root]
+    nodes = (Box, box.BoxList, tuple)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Box):
+            node_version = node._box_config["__version"]
+            children: Iterable = dict.values(node)
+        elif isinstance(node, box.BoxList):
+            node_version = node._version
+            children = list.__iter__(node)
+        else:
+            node_version = 0
+            children = node
+        if node_version > version:
+            version = node_version
+        for value in children:
+            if isinstance(value, nodes) and id(value) not in seen:
+                seen.add(id(value))
+                stack.append(value)
+    return version
+
+
+def _adopt(parent, child):
+    """
+    Link a Box or BoxList to the one it is stored in, so its changes are passed up to every ancestor.
+    A node stored in several places keeps a link to each of them, links to collected parents are dropped here.
+    """
+    if child is parent:
+        return
+    if isinstance(child, Box):
+        parents = child._box_config["__parent"]
+    elif isinstance(child, box.BoxList):
+        parents = child._parent
+    else:
+        return
+    if parents is None:
+        parents = (weakref.ref(parent),)
+    else:
+        alive = tuple(ref for ref in parents if ref() is not None)
+        if any(ref() is parent for ref in alive):
+            parents = alive
+        else:
+            parents = alive + (weakref.ref(parent),)
+    if isinstance(child, Box):
+        child._box_config["__parent"] = parents
+    else:
+        child._parent = parents
+
+
+def _propagate_version(parents: tuple, version: int):
+    """Give the version of a change to every ancestor linked by `_adopt`"""
+    stack = list(parents)
+    while stack:
+        parent = stack.pop()()
+        if parent is None:
+            continue
+        if isinstance(parent, Box):
+            config = parent._box_config
+            if config["__version"] == version:
+                # Already reached, through a shared or recursive reference
+                continue
+            config["__version"] = version
+            if config["__parent"] is not None:
+                stack.extend(config["__parent"])
+        else:
+            if parent._version == version:
+                continue
+            parent._version = version
+            if parent._parent is not None:
+                stack.extend(parent._parent)
+
+
 def _get_box_config():
     return {
         # Internal use only
         "__created": False,
-        "__safe_keys": {},
+        # Built on the first attribute miss, see Box.__safe_keys
+        "__safe_keys": None,
+        "__dotted_index": None,
+        # Number of the last change to this node, see _tree_version
+        "__version": 0,
+        # Weak references to the Boxes and BoxLists holding this one, only with box_track_changes
+        "__parent": None,
+        # Chosen on the first assignment, see _set_plan
+        "__set_plan": None,
+        # Frozen boxes only, see __hash__ and fingerprint
+        "__hash": None,
+        "__fingerprint": None,
     }
 
 
-def _get_property_func(obj, key):
+# Keys of a Box config or BoxList options that are specific to each node, so not shared when pickling
+_node_config_keys = (
+    "__created",
+    "__safe_keys",
+    "__dotted_index",
+    "__version",
+    "__parent",
+    "__set_plan",
+    "__hash",
+    "__fingerprint",
+    "__serialized",
+    "box_namespace",
+)
+
+
+def _set_plan(config):
+    """
+    Pick how __setitem__ stores keys for this configuration, so the options that can only change
+    what key is stored are checked once instead of on every assignment.
+    Anything that changes those options afterwards must reset "__set_plan" to None.
+    """
+    if (
+        config["box_dots"]
+        or config["box_recast"]
+        or config["camel_killer_box"]
+        or config["conversion_box"] == "eager"
+        or (config["conversion_box"] and config["box_duplicates"] != "ignore")
+    ):
+        return Box._Box__set_full
+    return Box._Box__set_plain
+
+
+def _child_namespace(namespace, key):
+    if namespace is None or namespace is False:
+        return namespace
+    return (*namespace, key)
+
+
+def _pickle_tree(root) -> tuple:
     """
-    Try to get property helper functions of given object and property name.
+    Flatten a tree of Box and BoxList objects into plain dicts, lists and tuples for pickling.
+
+    Instead of every node carrying its own config, distinct configs are stored once in a table and
+    each node gets a small `meta` entry, in the same order the plain structure is walked:
 
-    :param obj: object to be checked for property
-    :param key: property name
-    :return: a tuple for helper functions(fget, fset, fdel). If no such property, a (None, None, None) returns
+        None                    a dict or list that is kept as is
+        int                     a repeated (shared or recursive) node, by build order
+        (cls, config)           a Box or BoxList with the namespace its position implies
+        (cls, config, ns)       a Box or BoxList with an explicit namespace, None for none at all
+        (cls, config, ns, dict) as above, with extra instance attributes
+        (tuple,)                a plain tuple, whose items may be Box objects
     """
-    obj_type = type(obj)
+    configs: list[dict] = []
+    # (value getter, values) per config, so matching a node is one C level lookup and tuple compare
+    lookups: list[tuple[Callable, tuple]] = []
+    meta: list = []
+    memo: dict[int, int] = {}
+
+    def config_index(config: dict) -> int:
+        shared_size = len(config) - sum(1 for k in _node_config_keys if k in config)
+        for index in range(len(configs) - 1, -1, -1):
+            getter, values = lookups[index]
+            if len(configs[index]) == shared_size:
+                try:
+                    if getter(config) == values:
+                        return index
+                except KeyError:
+                    pass
+        shared = {k: v for k, v in config.items() if k not in _node_config_keys}
+        configs.append(shared)
+        getter = itemgetter(*shared) if shared else lambda _: ()
+        lookups.append((getter, getter(shared)))
+        return len(configs) - 1
+
+    def flatten(value, namespace, explicit=False):
+        if type(value) is tuple:
+            meta.append((tuple,))
+            return tuple(flatten(item, namespace) for item in value)
+        if not isinstance(value, (Box, box.BoxList)):
+            if isinstance(value, (dict, list)):
+                meta.append(None)
+            return value
+        if id(value) in memo:
+            meta.append(memo[id(value)])
+            return ()
+        memo[id(value)] = len(memo)
+        config = value._box_config if isinstance(value, Box) else value.box_options
+        entry: tuple = (type(value), config_index(config))
+        actual_namespace = config.get("box_namespace")
+        if isinstance(value, Box):
+            state = {k: v for k, v in value.__dict__.items() if k != "_box_config"}
+        else:
+            state = {k: v for k, v in value.__dict__.items() if k not in box.box_list._list_attributes}
+        if explicit or state or actual_namespace != namespace:
+            entry += (actual_namespace,)
+        if state:
+            entry += (state,)
+        meta.append(entry)
+        if isinstance(value, Box):
+            return {k: flatten(v, _child_namespace(actual_namespace, k)) for k, v in dict.items(value)}
+        return [flatten(item, actual_namespace) for item in list.__iter__(value)]
+
+    tree = flatten(root, None, explicit=True)
+    return configs, meta, tree
+
+
+def _unpickle_tree(configs: list[dict], meta: list, tree):
+    """Rebuild a tree flattened by `_pickle_tree` in a single pass, without re-converting any values."""
+    built: list = []
+    entries = iter(meta)
+
+    def rebuild(value, namespace):
+        # Same test as flatten, tuple subclasses such as namedtuples are left as they are
+        if type(value) is not tuple and not isinstance(value, (dict, list)):
+            return value
+        entry = next(entries)
+        if entry is None:
+            return value
+        if isinstance(entry, int):
+            return built[entry]
+        cls = entry[0]
+        if cls is tuple:
+            return tuple(rebuild(item, namespace) for item in value)
+        if len(entry) > 2:
+            namespace = entry[2]
+        config = dict(configs[entry[1]])
+        if namespace is not None:
+            config["box_namespace"] = namespace
+        obj = cls.__new__(cls)
+        built.append(obj)
+        if issubclass(cls, Box):
+            obj._box_config = _get_box_config()
+            obj._box_config.update(config)
+            obj._box_config["__created"] = True
+            obj._box_config["__set_plan"] = _set_plan(obj._box_config)
+            if len(entry) > 3:
+                obj.__dict__.update(entry[3])
+            for k, v in value.items():
+                dict.__setitem__(obj, k, rebuild(v, _child_namespace(namespace, k)))
+        else:
+            obj.box_options = config
+            if len(entry) > 3:
+                obj.__dict__.update(entry[3])
+            for item in value:
+                list.append(obj, rebuild(item, namespace))
+        if config.get("box_track_changes"):
+            for child in dict.values(obj) if isinstance(obj, Box) else list.__iter__(obj):
+                _adopt(obj, child)
+        return obj
+
+    return rebuild(tree, None)
+
 
-    if not hasattr(obj_type, key):
-        return None, None, None
-    attr = getattr(obj_type, key)
-    return attr.fget, attr.fset, attr.fdel
+def _cache_class_attributes(cls):
+    """
+    Store the protected key names and properties of a Box class on it, so attribute
+    assignment and deletion are hash lookups instead of searching the class.
+    Properties are only looked for when the class is defined.
+    """
+    properties = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if isinstance(attr, property):
+                properties[name] = attr
+            else:
+                properties.pop(name, None)
+    cls._protected_names = frozenset(cls._protected_keys)
+    cls._properties = properties
 
 
 class Box(dict):
@@ -164,17 +1066,18 @@ class Box(dict):
     :param default_box_none_transform: When using default_box, treat keys with none values as absent. True by default
     :param default_box_create_on_get: On lookup of a key that doesn't exist, create it if missing
     :param frozen_box: After creation, the box cannot be modified
-    :param camel_killer_box: Convert CamelCase to snake_case
-    :param conversion_box: Check for near matching keys as attributes
+    :param camel_killer_box: Convert CamelCase to snake_case, "eager" to also treat clashing keys as duplicates
+    :param conversion_box: Check for near matching keys as attributes, "eager" to store keys as their attribute names
     :param modify_tuples_box: Recreate incoming tuples with dicts into Boxes
     :param box_safe_prefix: Conversion box prefix for unsafe attributes
-    :param box_duplicates: "ignore", "error" or "warn" when duplicates exists in a conversion_box
+    :param box_duplicates: "ignore", "error" or "warn" when duplicates exists in a conversion_box or eager box
     :param box_intact_types: tuple of types to ignore converting
     :param box_recast: cast certain keys to a specified type
     :param box_dots: access nested Boxes by period separated keys in string
     :param box_dots_exclude: optional regular expression for dotted keys to exclude
     :param box_class: change what type of class sub-boxes will be created as
     :param box_namespace: the namespace this (possibly nested) Box lives within
+    :param box_track_changes: pass the version of every change up to all parent Boxes, see `changed_since`
     """
 
     _box_config: dict[str, Any]
@@ -188,7 +1091,25 @@ class Box(dict):
         "from_toml",
         "to_toml",
         "merge_update",
+        "walk",
+        "flatten",
+        "unflatten",
+        "set_in",
+        "evolve",
+        "fingerprint",
+        "intern",
+        "tree_version",
+        "changed_since",
+        "compile_path",
+        "to_snapshot",
+        "open_snapshot",
     ] + [attr for attr in dir({}) if not attr.startswith("_")]
+    _protected_names: frozenset[str]
+    _properties: dict[str, property]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _cache_class_attributes(cls)
 
     def __new__(
         cls,
@@ -198,8 +1119,8 @@ class Box(dict):
         default_box_none_transform: bool = True,
         default_box_create_on_get: bool = True,
         frozen_box: bool = False,
-        camel_killer_box: bool = False,
-        conversion_box: bool = True,
+        camel_killer_box: bool | Literal["eager"] = False,
+        conversion_box: bool | Literal["eager"] = True,
         modify_tuples_box: bool = False,
         box_safe_prefix: str = "x",
         box_duplicates: str = "ignore",
@@ -209,6 +1130,7 @@ class Box(dict):
         box_dots_exclude: str | None = None,
         box_class: dict | type[Box] | None = None,
         box_namespace: tuple[str, ...] | Literal[False] = (),
+        box_track_changes: bool = False,
         **kwargs: Any,
     ):
         """
@@ -235,6 +1157,7 @@ class Box(dict):
                 "box_dots_exclude": re.compile(box_dots_exclude) if box_dots_exclude else None,
                 "box_class": box_class if box_class is not None else Box,
                 "box_namespace": box_namespace,
+                "box_track_changes": box_track_changes,
             }
         )
         return obj
@@ -247,8 +1170,8 @@ class Box(dict):
         default_box_none_transform: bool = True,
         default_box_create_on_get: bool = True,
         frozen_box: bool = False,
-        camel_killer_box: bool = False,
-        conversion_box: bool = True,
+        camel_killer_box: bool | Literal["eager"] = False,
+        conversion_box: bool | Literal["eager"] = True,
         modify_tuples_box: bool = False,
         box_safe_prefix: str = "x",
         box_duplicates: str = "ignore",
@@ -258,6 +1181,7 @@ class Box(dict):
         box_dots_exclude: str | None = None,
         box_class: dict | type[Box] | None = None,
         box_namespace: tuple[str, ...] | Literal[False] = (),
+        box_track_changes: bool = False,
         **kwargs: Any,
     ):
         super().__init__()
@@ -280,10 +1204,19 @@ class Box(dict):
                 "box_dots_exclude": re.compile(box_dots_exclude) if box_dots_exclude else None,
                 "box_class": box_class if box_class is not None else self.__class__,
                 "box_namespace": box_namespace,
+                "box_track_changes": box_track_changes,
             }
         )
-        if not self._box_config["conversion_box"] and self._box_config["box_duplicates"] != "ignore":
+        for option in ("conversion_box", "camel_killer_box"):
+            if isinstance(self._box_config[option], str) and self._box_config[option] != "eager":
+                raise BoxValueError(f'{option} must be True, False or "eager"')
+        if (
+            not self._box_config["conversion_box"]
+            and self._box_config["camel_killer_box"] != "eager"
+            and self._box_config["box_duplicates"] != "ignore"
+        ):
             raise BoxError("box_duplicates are only for conversion_boxes")
+        self._box_config["__set_plan"] = _set_plan(self._box_config)
         if len(args) == 1:
             if isinstance(args[0], str):
                 raise BoxValueError("Cannot extrapolate Box from string")
@@ -381,12 +1314,61 @@ class Box(dict):
 
     def __hash__(self):
         if self._box_config["frozen_box"]:
-            hashing = 54321
-            for item in self.items():
-                hashing ^= hash(item)
+            # Frozen boxes cannot change, so the hash is only worked out once
+            hashing = self._box_config.get("__hash")
+            if hashing is None:
+                hashing = 54321
+                for item in self.items():
+                    hashing ^= hash(item)
+                self._box_config["__hash"] = hashing
             return hashing
         raise BoxTypeError('unhashable type: "Box"')
 
+    def fingerprint(self) -> str:
+        """
+        Hex digest of the content of the Box, stable across processes and python versions
+        unlike hash(), so it can be used as a cache key anywhere. Key order does not matter,
+        and lists and tuples with the same items match. Only built in scalar, mapping,
+        sequence and set values are supported. Cached for frozen boxes.
+
+        :return: 32 character hex string
+        """
+        return _fingerprint(self).hex()
+
+    def intern(self) -> dict[str, int]:
+        """
+        Share one object between structurally equal parts of a frozen Box, such as the same
+        settings block repeated in many places, and intern every string key and value.
+        The Box is changed in place but stays equal to what it was. Shared boxes keep the
+        namespace of the first place they were found.
+
+        :return: report with the number of "nodes" and "strings" replaced, and an estimate of "bytes_saved"
+        """
+        if not self._box_config["frozen_box"]:
+            raise BoxError("intern is only for frozen boxes, as the shared parts could otherwise be changed")
+        return _intern_tree(self)
+
+    def tree_version(self) -> int:
+        """
+        Number that goes up with every change to this Box or anything nested in it, made through Box
+        and BoxList objects. With `box_track_changes` every change is passed up to the parents as it
+        happens so this is instant, otherwise the whole tree is checked.
+
+        :return: version to give to `changed_since` later
+        """
+        return _tree_version(self)
+
+    def changed_since(self, version: int) -> bool:
+        """
+        Check if this Box or anything nested in it changed after `tree_version` returned the version.
+        With `box_track_changes` a Box or BoxList that was removed but is still changed elsewhere
+        may count as a change.
+
+        :param version: a version from `tree_version`
+        :return: True if anything changed
+        """
+        return _tree_version(self) > version
+
     def __dir__(self) -> list[str]:
         items = set(super().__dir__())
         # Only show items accessible by dot notation
@@ -406,53 +1388,54 @@ class Box(dict):
 
     def __contains__(self, item):
         in_me = super().__contains__(item)
+        if not in_me and isinstance(item, str) and self.__is_eager():
+            in_me = super().__contains__(self.__eager_key(item))
         if not self._box_config["box_dots"] or not isinstance(item, str):
             return in_me
         if in_me:
             return True
-        if "." not in item:
+        if not self.__process_dotted_key(item):
             return False
+        box_path = _cached_box_path(item)
+        if box_path is not None and box_path._resolve(self) is not NO_PATH_MATCH:
+            return True
         try:
             first_item, children = _parse_box_dots(self, item)
         except BoxError:
             return False
-        else:
-            if not super().__contains__(first_item):
-                return False
-            it = self[first_item]
-            return isinstance(it, Iterable) and children in it
+        if not super().__contains__(first_item):
+            return False
+        # Only follow the one branch the path points to, so this costs the depth of the path
+        it = super().__getitem__(first_item)
+        if isinstance(it, box.BoxList):
+            return it._dotted_contains(children)
+        return isinstance(it, dict) and children in it
 
-    def keys(self, dotted: bool = False):
+    def keys(self, dotted: bool = False, sort: bool = True):
         if not dotted:
             return super().keys()
 
         if not self._box_config["box_dots"]:
             raise BoxError("Cannot return dotted keys as this Box does not have `box_dots` enabled")
 
-        keys = set()
-        for key, value in self.items():
-            added = False
-            if isinstance(key, str):
-                if isinstance(value, Box):
-                    for sub_key in value.keys(dotted=True):
-                        keys.add(f"{key}.{sub_key}")
-                        added = True
-                elif isinstance(value, box.BoxList):
-                    for pos in value._dotted_helper():
-                        keys.add(f"{key}{pos}")
-                        added = True
-                if not added:
-                    keys.add(key)
-        return sorted(keys, key=lambda x: str(x))
-
-    def items(self, dotted: bool = False):
+        index = _dotted_index(self)
+        if not sort:
+            return list(index.entries)
+        if index.sorted_keys is None:
+            index.sorted_keys = sorted(index.entries)
+        return list(index.sorted_keys)
+
+    def items(self, dotted: bool = False, sort: bool = True):
         if not dotted:
             return super().items()
 
         if not self._box_config["box_dots"]:
             raise BoxError("Cannot return dotted keys as this Box does not have `box_dots` enabled")
 
-        return [(k, self[k]) for k in self.keys(dotted=True)]
+        entries = _dotted_index(self).entries
+        if not sort:
+            return list(entries.items())
+        return [(k, entries[k]) for k in self.keys(dotted=True)]
 
     def get(self, key, default=NO_DEFAULT):
         if key not in self:
@@ -488,8 +1471,18 @@ class Box(dict):
         out._box_config["frozen_box"] = frozen
         return out
 
+    def __reduce__(self):
+        return _unpickle_tree, _pickle_tree(self)
+
     def __setstate__(self, state):
-        self._box_config = state["_box_config"]
+        # Only used by pickles made before the whole tree was pickled at once, whose configs
+        # lack the options and per node keys added since, so those start from the defaults
+        config = _get_box_config()
+        config["box_track_changes"] = False
+        config.update((k, v) for k, v in state["_box_config"].items() if not k.startswith("__"))
+        config["__created"] = True
+        config["__set_plan"] = _set_plan(config)
+        state = {**state, "_box_config": config}
         self.__dict__.update(state)
 
     def __process_dotted_key(self, item):
@@ -511,26 +1504,11 @@ class Box(dict):
         elif isinstance(default_value, list):
             value = box.BoxList(**self.__box_config(extra_namespace=item))
         elif isinstance(default_value, Callable):
-            args = []
-            kwargs = {}
-            p_sigs = [
-                p.name
-                for p in signature(default_value).parameters.values()
-                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
-            ]
-            k_sigs = [p.name for p in signature(default_value).parameters.values() if p.kind is p.KEYWORD_ONLY]
-            for name in p_sigs:
-                if name not in ("key", "box_instance"):
-                    raise BoxError("default_box_attr can only have the arguments 'key' and 'box_instance'")
-            if "key" in p_sigs:
-                args.append(item)
-            if "box_instance" in p_sigs:
-                args.insert(p_sigs.index("box_instance"), self)
-            if "key" in k_sigs:
-                kwargs["key"] = item
-            if "box_instance" in k_sigs:
-                kwargs["box_instance"] = self
-            value = default_value(*args, **kwargs)
+            positional, keywords = _default_box_attr_arguments(default_value)
+            arguments = {"key": item, "box_instance": self}
+            value = default_value(
+                *(arguments[name] for name in positional), **{name: arguments[name] for name in keywords}
+            )
         elif hasattr(default_value, "copy"):
             value = default_value.copy()
         else:
@@ -543,11 +1521,15 @@ class Box(dict):
                         if hasattr(self[first_item], "__setitem__"):
                             self[first_item].__setitem__(children, value)
                     else:
+                        self.__changed()
                         super().__setitem__(
                             first_item, self._box_config["box_class"](**self.__box_config(extra_namespace=first_item))
                         )
+                        self.__adopt(super().__getitem__(first_item))
                         self[first_item].__setitem__(children, value)
                 else:
+                    self.__changed()
+                    self.__adopt(value)
                     super().__setitem__(item, value)
         return value
 
@@ -572,10 +1554,25 @@ class Box(dict):
                 raise BoxValueError(f"Cannot convert {value} to {recast}") from _exception_cause(err)
         return value
 
+    def __changed(self):
+        # What was worked out from the old contents of this node is out of date
+        self._box_config["__dotted_index"] = None
+        _last_version[0] = self._box_config["__version"] = next(_versions)
+        if self._box_config["__parent"] is not None:
+            _propagate_version(self._box_config["__parent"], _last_version[0])
+
+    def __adopt(self, child):
+        if self._box_config["box_track_changes"]:
+            _adopt(self, child)
+
     def __convert_and_store(self, item, value):
-        if self._box_config["conversion_box"]:
-            safe_key = self._safe_attr(item)
-            self._box_config["__safe_keys"][safe_key] = item
+        # Inlined __changed, as this is the path of every stored value
+        self._box_config["__dotted_index"] = None
+        _last_version[0] = self._box_config["__version"] = next(_versions)
+        if self._box_config["__parent"] is not None:
+            _propagate_version(self._box_config["__parent"], _last_version[0])
+        if self._box_config["conversion_box"] and self._box_config["__safe_keys"] is not None:
+            self._box_config["__safe_keys"][self._safe_attr(item)] = item
         if isinstance(value, (int, float, str, bytes, bytearray, bool, complex, set, frozenset)):
             return super().__setitem__(item, value)
         # If the value has already been converted or should not be converted, return it as-is
@@ -598,6 +1595,7 @@ class Box(dict):
             value.box_options.update(self.__box_config(extra_namespace=item))
         elif self._box_config["modify_tuples_box"] and isinstance(value, tuple):
             value = _recursive_tuples(value, recreate_tuples=True, **self.__box_config(extra_namespace=item))
+        self.__adopt(value)
         super().__setitem__(item, value)
 
     def __getitem__(self, item, _ignore_default=False):
@@ -614,6 +1612,11 @@ class Box(dict):
                     new_box[x] = self[x]
                 return new_box
             if self.__process_dotted_key(item):
+                box_path = _cached_box_path(item)
+                if box_path is not None:
+                    value = box_path._resolve(self)
+                    if value is not NO_PATH_MATCH:
+                        return value
                 try:
                     first_item, children = _parse_box_dots(self, item)
                 except BoxError:
@@ -623,7 +1626,11 @@ class Box(dict):
                 if first_item in self.keys():
                     if hasattr(self[first_item], "__getitem__"):
                         return self[first_item][children]
-            if self._box_config["camel_killer_box"] and isinstance(item, str):
+            if isinstance(item, str) and self.__is_eager():
+                value = dict.get(self, self.__eager_key(item), NO_DEFAULT)
+                if value is not NO_DEFAULT:
+                    return value
+            elif self._box_config["camel_killer_box"] and isinstance(item, str):
                 converted = _camel_killer(item)
                 if converted in self.keys():
                     return super().__getitem__(converted)
@@ -639,46 +1646,104 @@ class Box(dict):
             raise BoxTypeError(str(err)) from _exception_cause(err)
 
     def __getattr__(self, item):
-        try:
+        # Every source is checked with plain lookups, the only exception raised is the final one
+        plain_lookup = type(self).__getitem__ is Box.__getitem__
+        if plain_lookup:
+            value = dict.get(self, item, NO_DEFAULT)
+            if value is not NO_DEFAULT:
+                return value
+        if item == "_box_config":
+            if "_box_config" in self.__dict__:
+                # Only when called directly, attribute access finds it before ever calling __getattr__
+                return self.__dict__["_box_config"]
+            raise BoxError("_box_config key must exist")
+        if not plain_lookup or self.__process_dotted_key(item):
+            # Overridden lookups and box_dots paths still go through __getitem__
             try:
-                value = self.__getitem__(item, _ignore_default=True)
+                return self.__getitem__(item, _ignore_default=True)
             except KeyError:
-                value = object.__getattribute__(self, item)
-        except AttributeError as err:
-            if item == "__getstate__":
-                raise BoxKeyError(item) from _exception_cause(err)
-            if item == "_box_config":
-                raise BoxError("_box_config key must exist") from _exception_cause(err)
-            if self._box_config["conversion_box"]:
-                safe_key = self._safe_attr(item)
-                if safe_key in self._box_config["__safe_keys"]:
-                    return self.__getitem__(self._box_config["__safe_keys"][safe_key])
-            if self._box_config["default_box"]:
-                if item.startswith("_") and item.endswith("_"):
-                    raise BoxKeyError(f"{item}: Does not exist and internal methods are never defaulted")
-                return self.__get_default(item, attr=True)
-            raise BoxKeyError(str(err)) from _exception_cause(err)
-        return value
+                pass
+        elif self._box_config["camel_killer_box"] and isinstance(item, str):
+            value = dict.get(self, _camel_killer(item), NO_DEFAULT)
+            if value is not NO_DEFAULT:
+                return value
+        if item == "__getstate__":
+            raise BoxKeyError(item)
+        if item in self.__dict__ or getattr(type(self), item, NO_DEFAULT) is not NO_DEFAULT:
+            # Regular attributes, for when __getattr__ is called directly or a property raised AttributeError
+            try:
+                return object.__getattribute__(self, item)
+            except AttributeError:
+                pass
+        if self._box_config["conversion_box"]:
+            safe_key = self._safe_attr(item)
+            safe_keys = self.__safe_keys()
+            if safe_key in safe_keys:
+                return self.__getitem__(safe_keys[safe_key])
+        if self._box_config["default_box"]:
+            if item.startswith("_") and item.endswith("_"):
+                raise BoxKeyError(f"{item}: Does not exist and internal methods are never defaulted")
+            return self.__get_default(item, attr=True)
+        raise BoxKeyError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
 
     def __setitem__(self, key, value):
+        plan = self._box_config.get("__set_plan")
+        if plan is None:
+            plan = self._box_config["__set_plan"] = _set_plan(self._box_config)
+        return plan(self, key, value)
+
+    def __set_plain(self, key, value):
+        # No dotted paths, recasting or key normalizing, so the key is always stored as given
+        config = self._box_config
+        if config["frozen_box"] and config["__created"] and key != "_box_config":
+            raise BoxError("Box is frozen")
+        if not isinstance(value, (int, float, str, bytes, bytearray, bool, complex, set, frozenset)):
+            return self.__convert_and_store(key, value)
+        config["__dotted_index"] = None
+        _last_version[0] = config["__version"] = next(_versions)
+        if config["__parent"] is not None:
+            _propagate_version(config["__parent"], _last_version[0])
+        if config["__safe_keys"] is not None and config["conversion_box"]:
+            config["__safe_keys"][self._safe_attr(key)] = key
+        dict.__setitem__(self, key, value)
+
+    def __set_full(self, key, value):
         if key != "_box_config" and self._box_config["frozen_box"] and self._box_config["__created"]:
             raise BoxError("Box is frozen")
         if self.__process_dotted_key(key):
+            box_path = _cached_box_path(key)
+            if box_path is not None:
+                parent = box_path._resolve(self, literal_first=False, parent_only=True)
+                last = box_path.segments[-1]
+                if (isinstance(parent, Box) and isinstance(last, str)) or (
+                    isinstance(parent, box.BoxList) and isinstance(last, int) and last < len(parent)
+                ):
+                    return parent.__setitem__(last, value)
             first_item, children = _parse_box_dots(self, key, setting=True)
             if first_item in self.keys():
                 if hasattr(self[first_item], "__setitem__"):
                     return self[first_item].__setitem__(children, value)
             elif self._box_config["default_box"]:
+                self.__changed()
                 if children[0] == "[":
                     super().__setitem__(first_item, box.BoxList(**self.__box_config(extra_namespace=first_item)))
                 else:
                     super().__setitem__(
                         first_item, self._box_config["box_class"](**self.__box_config(extra_namespace=first_item))
                     )
+                self.__adopt(super().__getitem__(first_item))
                 return self[first_item].__setitem__(children, value)
             else:
                 raise BoxKeyError(f"'{self.__class__}' object has no attribute {first_item}")
         value = self.__recast(key, value)
+        if isinstance(key, str) and (
+            self._box_config["conversion_box"] == "eager" or self._box_config["camel_killer_box"] == "eager"
+        ):
+            # Keys are stored normalized, so lookups by the normalized names are plain dictionary hits
+            normalized = self.__eager_key(key)
+            if not self._box_config["__created"] and normalized in self.keys():
+                self.__duplicate_key(key, normalized)
+            return self.__convert_and_store(normalized, value)
         if key not in self.keys() and self._box_config["camel_killer_box"]:
             if self._box_config["camel_killer_box"] and isinstance(key, str):
                 key = _camel_killer(key)
@@ -686,20 +1751,46 @@ class Box(dict):
             self._conversion_checks(key)
         self.__convert_and_store(key, value)
 
+    def __is_eager(self) -> bool:
+        return self._box_config["conversion_box"] == "eager" or self._box_config["camel_killer_box"] == "eager"
+
+    def __eager_key(self, key: str) -> str:
+        """Name a string key is stored under when either conversion_box or camel_killer_box is "eager" """
+        normalized = _camel_killer(key) if self._box_config["camel_killer_box"] else key
+        if self._box_config["conversion_box"] == "eager":
+            normalized = self._safe_attr(normalized)
+        return normalized
+
+    def __store_eager(self, key, value):
+        self.__convert_and_store(self.__eager_key(key) if isinstance(key, str) else key, value)
+
+    def __duplicate_key(self, key, normalized):
+        """Apply the box_duplicates policy to two keys loaded into an eager box that normalize to the same name"""
+        if self._box_config["box_duplicates"] == "ignore":
+            return
+        message = f'Duplicate keys exist: "{key}" and an earlier key both become "{normalized}"'
+        if self._box_config["box_duplicates"].startswith("warn"):
+            warnings.warn(message, BoxWarning)
+        else:
+            raise BoxError(message)
+
     def __setattr__(self, key, value):
         if key == "_box_config":
             return object.__setattr__(self, key, value)
         if self._box_config["frozen_box"] and self._box_config["__created"]:
             raise BoxError("Box is frozen")
-        if key in self._protected_keys:
+        if key in self._protected_names:
             raise BoxKeyError(f'Key name "{key}" is protected')
 
-        safe_key = self._safe_attr(key)
-        if safe_key in self._box_config["__safe_keys"]:
-            key = self._box_config["__safe_keys"][safe_key]
+        if self._box_config["conversion_box"] and not dict.__contains__(self, key):
+            safe_key = self._safe_attr(key)
+            safe_keys = self.__safe_keys()
+            if safe_key in safe_keys:
+                key = safe_keys[safe_key]
 
         # if user has customized property setter, fall back to default implementation
-        if _get_property_func(self, key)[1] is not None:
+        prop = self._properties.get(key)
+        if prop is not None and prop.fset is not None:
             super().__setattr__(key, value)
         else:
             self.__setitem__(key, value)
@@ -714,39 +1805,42 @@ class Box(dict):
                 raise BoxKeyError(str(key)) from None
             if hasattr(self[first_item], "__delitem__"):
                 return self[first_item].__delitem__(children)
-        if key not in self.keys() and self._box_config["camel_killer_box"]:
-            if self._box_config["camel_killer_box"] and isinstance(key, str):
-                for each_key in self:
-                    if _camel_killer(key) == each_key:
-                        key = each_key
-                        break
+        if self._box_config["camel_killer_box"] and isinstance(key, str) and key not in self.keys():
+            converted = _camel_killer(key)
+            if converted in self.keys():
+                key = converted
+        self.__changed()
         try:
             super().__delitem__(key)
         except KeyError as err:
             raise BoxKeyError(str(err)) from _exception_cause(err)
+        safe_keys = self._box_config["__safe_keys"]
+        if safe_keys:
+            safe_key = self._safe_attr(key)
+            if safe_key in safe_keys and safe_keys[safe_key] == key:
+                del safe_keys[safe_key]
 
     def __delattr__(self, item):
         if self._box_config["frozen_box"]:
             raise BoxError("Box is frozen")
         if item == "_box_config":
             raise BoxError('"_box_config" is protected')
-        if item in self._protected_keys:
+        if item in self._protected_names:
             raise BoxKeyError(f'Key name "{item}" is protected')
 
-        property_fdel = _get_property_func(self, item)[2]
-
         # if user has customized property deleter, route to it
-        if property_fdel is not None:
-            property_fdel(self)
+        prop = self._properties.get(item)
+        if prop is not None and prop.fdel is not None:
+            prop.fdel(self)
             return
         try:
             self.__delitem__(item)
         except KeyError as err:
             if self._box_config["conversion_box"]:
                 safe_key = self._safe_attr(item)
-                if safe_key in self._box_config["__safe_keys"]:
-                    self.__delitem__(self._box_config["__safe_keys"][safe_key])
-                    del self._box_config["__safe_keys"][safe_key]
+                safe_keys = self.__safe_keys()
+                if safe_key in safe_keys:
+                    self.__delitem__(safe_keys[safe_key])
                     return
             raise BoxKeyError(str(err)) from _exception_cause(err)
 
@@ -776,7 +1870,8 @@ class Box(dict):
         if self._box_config["frozen_box"]:
             raise BoxError("Box is frozen")
         super().clear()
-        self._box_config["__safe_keys"].clear()
+        self._box_config["__safe_keys"] = None
+        self.__changed()
 
     def popitem(self):
         if self._box_config["frozen_box"]:
@@ -801,37 +1896,143 @@ class Box(dict):
         for key in reversed(list(self.keys())):
             yield key
 
-    def to_dict(self) -> dict:
+    def walk(
+        self, order: str = "pre", leaves_only: bool = False, max_depth: int | None = None, dotted: bool = False
+    ) -> Generator:  # type: ignore[type-arg]
+        """
+        Iterate over every nested key and value as `(path, value)`, where path is a tuple of the keys
+        and list positions leading to the value. Works without recursion, so any depth is safe.
+
+        :param order: "pre" to yield containers before their contents, "post" for after
+        :param leaves_only: only yield values that are not walked into, including empty containers
+        :param max_depth: do not walk into containers at this depth, yielding them as leaves
+        :param dotted: yield the path as a box_dots style string, such as "a.b[0].c", instead of a tuple
+        :return: generator of path and value pairs
+        """
+        return _walk(self, order=order, leaves_only=leaves_only, max_depth=max_depth, dotted=dotted)
+
+    def flatten(self, sep: str = ".", list_style: str = "[i]") -> dict:
+        """
+        Turn the Box into a flat dictionary of every end value by its path, such as `{"a.b[0].c": 1}`.
+        With the defaults the paths are the same as used by `box_dots`. Empty containers are kept as values.
+
+        :param sep: separator between keys
+        :param list_style: "[i]" for list positions in brackets, "i" to treat them as another key, such as "a.b.0.c"
+        :return: python dictionary of paths and values
+        """
+        if list_style not in _flat_list_styles:
+            raise BoxValueError(f'list_style must be one of {", ".join(_flat_list_styles)}, not "{list_style}"')
+        flat = {}
+        for path, value in _walk_tree(self, False, True, None, True, sep=sep, brackets=list_style == "[i]"):
+            if isinstance(value, Box):
+                value = {}
+            elif isinstance(value, box.BoxList) or type(value) is tuple:
+                # Only empty ones are left as values, a frozen Box gives the same paths as an unfrozen one
+                value = []
+            flat[path] = value
+        return flat
+
+    def set_in(self, path: str | tuple, value: Any) -> Box:
+        """
+        Return a new frozen Box with the value at the path replaced, leaving this one as it is.
+        Only the boxes, BoxLists and tuples along the path are copied, every other value is shared
+        with this Box, so an update costs the depth of the path rather than the size of the tree.
+        Missing keys along the path are created.
+
+        :param path: box_dots style path such as "a.b[0].c", or a tuple of keys and list positions
+        :param value: value to store, converted the same as any value of a frozen Box
+        :return: new frozen Box
+        """
+        return self.evolve({path: value})
+
+    def evolve(self, changes: Mapping | None = None, **kwargs: Any) -> Box:
+        """
+        Return a new frozen Box with several values replaced, the same as calling `set_in` for each,
+        with the boxes along the paths only copied once.
+
+        :param changes: mapping of paths to values
+        :param kwargs: top level keys and values
+        :return: new frozen Box
+        """
+        if not self._box_config["frozen_box"]:
+            raise BoxError("set_in and evolve are only for frozen boxes, as untouched values are shared")
+        new_box = self
+        fresh: set[int] = set()
+        for path, value in {**(changes or {}), **kwargs}.items():
+            if isinstance(path, tuple):
+                segments, remainders = path, ()
+            else:
+                box_path = _cached_box_path(path) if isinstance(path, str) else None
+                if box_path is None or dict.__contains__(new_box, path):
+                    segments, remainders = (path,), ()
+                else:
+                    segments, remainders = box_path.segments, box_path.remainders
+            if not segments:
+                raise BoxValueError("Path must not be empty")
+            new_box = _set_in(new_box, segments, remainders, value, fresh)
+        return new_box
+
+    @classmethod
+    def unflatten(cls, mapping: Mapping, sep: str = ".", list_style: str = "[i]", **kwargs) -> Box:
+        """
+        Build a Box from a flat mapping of paths and values, as made by `flatten`.
+        With list_style "i" every key made of only digits is a list position.
+
+        :param mapping: flat mapping of paths and values
+        :param sep: separator between keys
+        :param list_style: "[i]" for list positions in brackets, "i" to treat them as another key, such as "a.b.0.c"
+        :param kwargs: parameters to pass to the Box() call
+        :return: Box
+        """
+        if list_style not in _flat_list_styles:
+            raise BoxValueError(f'list_style must be one of {", ".join(_flat_list_styles)}, not "{list_style}"')
+        root = cls(**kwargs)
+        config = root._box_config
+        if (
+            config["frozen_box"]
+            or config["camel_killer_box"]
+            or config["conversion_box"] == "eager"
+            or config["box_recast"]
+            or config["box_duplicates"] != "ignore"
+            or config["box_track_changes"]
+            or not (isinstance(config["box_class"], type) and issubclass(config["box_class"], Box))
+        ):
+            # Keys may be changed, checked or linked as they are stored, so build plain containers and convert them
+            return cls(_unflatten(mapping, sep, list_style), **kwargs)
+        return _unflatten(mapping, sep, list_style, root=root)  # type: ignore[return-value]
+
+    def to_dict(self, views: bool = False) -> dict:
         """
-        Turn the Box and sub Boxes back into a native python dictionary.
+        Turn the Box and sub Boxes back into a native python dictionary. Works without recursion,
+        and a Box or BoxList found in several places, including inside itself, is copied once
+        and used in each of those places.
 
+        :param views: instead of copying nested Boxes that hold no other Box or BoxList, use a
+            read only types.MappingProxyType view of them, which follows any later changes.
+            Boxes with default_box are always copied.
         :return: python dictionary of this Box
         """
-        out_dict = dict(self)
-        for k, v in out_dict.items():
-            if v is self:
-                out_dict[k] = out_dict
-            elif isinstance(v, Box):
-                out_dict[k] = v.to_dict()
-            elif isinstance(v, box.BoxList):
-                out_dict[k] = v.to_list()
-        return out_dict
+        return _to_native(self, views=views)
 
     def update(self, *args, **kwargs):
         if self._box_config["frozen_box"]:
             raise BoxError("Box is frozen")
         if (len(args) + int(bool(kwargs))) > 1:
             raise BoxTypeError(f"update expected at most 1 argument, got {len(args) + int(bool(kwargs))}")
+        if self.__is_eager():
+            store = self.__store_eager
+        else:
+            store = self.__convert_and_store
         single_arg = next(iter(args), None)
         if single_arg:
             if hasattr(single_arg, "keys"):
                 for k in single_arg:
-                    self.__convert_and_store(k, single_arg[k])
+                    store(k, single_arg[k])
             else:
                 for k, v in single_arg:
-                    self.__convert_and_store(k, v)
+                    store(k, v)
         for k in kwargs:
-            self.__convert_and_store(k, kwargs[k])
+            store(k, kwargs[k])
 
     def merge_update(self, *args, **kwargs):
         merge_type = None
@@ -842,10 +2043,16 @@ class Box(dict):
         was_frozen = self._box_config["frozen_box"]
         if force_unfrozen:
             self._box_config["frozen_box"] = False
+            self._box_config["__hash"] = None
+            self._box_config["__fingerprint"] = None
+            self._box_config["__serialized"] = None
 
         try:
 
             def convert_and_set(k, v):
+                if isinstance(k, str) and self.__is_eager():
+                    # Merged into the subtree stored under the normalized key, not replacing it
+                    k = self.__eager_key(k)
                 intact_type = self._box_config["box_intact_types"] and isinstance(
                     v, self._box_config["box_intact_types"]
                 )
@@ -887,13 +2094,11 @@ class Box(dict):
                 self._box_config["frozen_box"] = was_frozen
 
     def setdefault(self, item, default=None):
+        if isinstance(item, str) and self.__is_eager():
+            item = self.__eager_key(item)
         if item in self:
             return self[item]
 
-        if self._box_config["box_dots"]:
-            if item in _get_dot_paths(self):
-                return self[item]
-
         if isinstance(default, dict):
             default = self._box_config["box_class"](default, **self.__box_config(extra_namespace=item))
         if isinstance(default, list):
@@ -907,47 +2112,20 @@ class Box(dict):
             # By assuming most people are using string first we get substantial speed ups
             if attr.isidentifier() and not iskeyword(attr):
                 return attr
-
         if isinstance(attr, tuple):
-            attr = "_".join([str(x) for x in attr])
-
-        attr = attr.decode("utf-8", "ignore") if isinstance(attr, bytes) else str(attr)
-        if self.__box_config()["camel_killer_box"]:
-            attr = _camel_killer(attr)
-
-        if attr.isidentifier() and not iskeyword(attr):
-            return attr
-
-        if sum(1 for character in attr if character.isidentifier() and not iskeyword(character)) == 0:
-            attr = f'{self.__box_config()["box_safe_prefix"]}{attr}'
-            if attr.isidentifier() and not iskeyword(attr):
-                return attr
-
-        out = []
-        last_safe = 0
-        for i, character in enumerate(attr):
-            if f"x{character}".isidentifier():
-                last_safe = i
-                out.append(character)
-            elif not out:
-                continue
-            else:
-                if last_safe == i - 1:
-                    out.append("_")
-
-        out = "".join(out)[: last_safe + 1]
-
-        try:
-            int(out[0])
-        except (ValueError, IndexError):
-            pass
-        else:
-            out = f'{self.__box_config()["box_safe_prefix"]}{out}'
-
-        if iskeyword(out):
-            out = f'{self.__box_config()["box_safe_prefix"]}{out}'
+            # Tuples of equal but differently typed items, such as (1,) and (True,), would share a memo entry
+            return _safe_name.__wrapped__(
+                attr, bool(self._box_config["camel_killer_box"]), self._box_config["box_safe_prefix"]
+            )
+        return _safe_name(attr, bool(self._box_config["camel_killer_box"]), self._box_config["box_safe_prefix"])
 
-        return out
+    def __safe_keys(self) -> dict:
+        """Map of safe attribute names to keys, only built once an attribute is not found as a key"""
+        safe_keys = self._box_config["__safe_keys"]
+        if safe_keys is None:
+            safe_keys = {self._safe_attr(key): key for key in dict.keys(self)}
+            self._box_config["__safe_keys"] = safe_keys
+        return safe_keys
 
     def _conversion_checks(self, item):
         """
@@ -956,9 +2134,10 @@ class Box(dict):
         :param item: Item to see if a dup exists
         """
         safe_item = self._safe_attr(item)
+        safe_keys = self.__safe_keys()
 
-        if safe_item in self._box_config["__safe_keys"]:
-            dups = [f"{item}({safe_item})", f'{self._box_config["__safe_keys"][safe_item]}({safe_item})']
+        if safe_item in safe_keys:
+            dups = [f"{item}({safe_item})", f"{safe_keys[safe_item]}({safe_item})"]
             if self._box_config["box_duplicates"].startswith("warn"):
                 warnings.warn(f"Duplicate conversion attributes exist: {dups}", BoxWarning)
             else:
@@ -980,7 +2159,8 @@ class Box(dict):
         :param json_kwargs: additional arguments to pass to json.dump(s)
         :return: string of JSON (if no filename provided)
         """
-        return _to_json(self.to_dict(), filename=filename, encoding=encoding, errors=errors, **json_kwargs)
+        # Box is a dict, so it is encoded as it is, json.dump writes it out in chunks as it goes
+        return _to_json(self, filename=filename, encoding=encoding, errors=errors, **json_kwargs)
 
     @classmethod
     def from_json(
@@ -1013,6 +2193,52 @@ class Box(dict):
             raise BoxError(f"json data not returned as a dictionary, but rather a {type(data).__name__}")
         return cls(data, **box_args)
 
+    @staticmethod
+    def compile_path(path: str) -> BoxPath:
+        """
+        Parse a box_dots style path once, for repeated lookups of the same path.
+
+        >>> first_id = Box.compile_path("payload.items[0].id")
+        >>> first_id(my_box)
+
+        :param path: dotted path such as "a.b[3].c"
+        :return: callable BoxPath, also offering `get(box, default)`
+        """
+        box_path = _cached_box_path(path)
+        if box_path is None:
+            raise BoxValueError(f'"{path}" is not a valid box_dots path')
+        return box_path
+
+    def to_snapshot(self, filename: str | PathLike):
+        """
+        Write the Box to a binary snapshot file that can be memory mapped by `Box.open_snapshot`.
+
+        Values are stored with pickle, so only open snapshots from trusted sources.
+
+        :param filename: File to write the snapshot to
+        """
+        from box.snapshot import _write_snapshot
+
+        _write_snapshot(self, filename)
+
+    @classmethod
+    def open_snapshot(cls, filename: str | PathLike, box_dots: bool = False) -> box.snapshot.SnapshotBox:
+        """
+        Memory map a snapshot file written by `to_snapshot`. Nothing is decoded up front,
+        each key lookup uses the snapshot's index and only decodes the value asked for,
+        so many processes opening the same file share it through the page cache.
+
+        :param filename: snapshot file to open
+        :param box_dots: access nested values by period separated keys in string
+        :return: read-only SnapshotBox view of the data
+        """
+        from box.snapshot import SnapshotBox, _open_snapshot
+
+        snapshot = _open_snapshot(filename, box_dots=box_dots)
+        if not isinstance(snapshot, SnapshotBox):
+            raise BoxError(f"snapshot data is not a dictionary but rather a {type(snapshot).__name__}")
+        return snapshot
+
     if yaml_available:
 
         def to_yaml(
@@ -1275,3 +2501,6 @@ class Box(dict):
             **kwargs,
         ) -> Box:
             raise BoxError('toon is unavailable on this system, please install the "toon_format" package')
+
+
+_cache_class_attributes(Box)
@@ -3,6 +3,16 @@ from collections.abc import Generator, Mapping
 from os import PathLike
 from typing import Any, Literal
 
+from box.snapshot import SnapshotBox
+
+class BoxPath:
+    path: str
+    segments: tuple[str | int, ...]
+    remainders: tuple[str, ...]
+    def __init__(self, path: str) -> None: ...
+    def __call__(self, obj: Any) -> Any: ...
+    def get(self, obj: Any, default: Any = ...) -> Any: ...
+
 class Box(dict):
     def __new__(
         cls,
@@ -12,8 +22,8 @@ class Box(dict):
         default_box_none_transform: bool = ...,
         default_box_create_on_get: bool = ...,
         frozen_box: bool = ...,
-        camel_killer_box: bool = ...,
-        conversion_box: bool = ...,
+        camel_killer_box: bool | Literal["eager"] = ...,
+        conversion_box: bool | Literal["eager"] = ...,
         modify_tuples_box: bool = ...,
         box_safe_prefix: str = ...,
         box_duplicates: str = ...,
@@ -23,6 +33,7 @@ class Box(dict):
         box_dots_exclude: str | None = ...,
         box_class: dict | type[Box] | None = ...,
         box_namespace: tuple[str, ...] | Literal[False] = ...,
+        box_track_changes: bool = ...,
         **kwargs: Any,
     ): ...
     def __init__(
@@ -33,8 +44,8 @@ class Box(dict):
         default_box_none_transform: bool = ...,
         default_box_create_on_get: bool = ...,
         frozen_box: bool = ...,
-        camel_killer_box: bool = ...,
-        conversion_box: bool = ...,
+        camel_killer_box: bool | Literal["eager"] = ...,
+        conversion_box: bool | Literal["eager"] = ...,
         modify_tuples_box: bool = ...,
         box_safe_prefix: str = ...,
         box_duplicates: str = ...,
@@ -44,6 +55,7 @@ class Box(dict):
         box_dots_exclude: str | None = ...,
         box_class: dict | type[Box] | None = ...,
         box_namespace: tuple[str, ...] | Literal[False] = ...,
+        box_track_changes: bool = ...,
         **kwargs: Any,
     ) -> None: ...
     def __add__(self, other: Mapping[Any, Any]): ...
@@ -54,10 +66,14 @@ class Box(dict):
     def __ior__(self, other: Mapping[Any, Any]): ...  # type: ignore[override]
     def __sub__(self, other: Mapping[Any, Any]): ...
     def __hash__(self): ...
+    def fingerprint(self) -> str: ...
+    def intern(self) -> dict[str, int]: ...
+    def tree_version(self) -> int: ...
+    def changed_since(self, version: int) -> bool: ...
     def __dir__(self) -> list[str]: ...
     def __contains__(self, item) -> bool: ...
-    def keys(self, dotted: bool = ...): ...
-    def items(self, dotted: bool = ...): ...
+    def keys(self, dotted: bool = ..., sort: bool = ...): ...
+    def items(self, dotted: bool = ..., sort: bool = ...): ...
     def get(self, key, default=...): ...
     def copy(self) -> Box: ...
     def __copy__(self) -> Box: ...
@@ -73,7 +89,19 @@ class Box(dict):
     def popitem(self): ...
     def __iter__(self) -> Generator: ...
     def __reversed__(self) -> Generator: ...
-    def to_dict(self) -> dict: ...
+    def flatten(self, sep: str = ..., list_style: Literal["[i]", "i"] = ...) -> dict: ...
+    def set_in(self, path: str | tuple, value: Any) -> Box: ...
+    def evolve(self, changes: Mapping | None = ..., **kwargs: Any) -> Box: ...
+    @classmethod
+    def unflatten(cls, mapping: Mapping, sep: str = ..., list_style: Literal["[i]", "i"] = ..., **kwargs) -> Box: ...
+    def to_dict(self, views: bool = ...) -> dict: ...
+    def walk(
+        self,
+        order: Literal["pre", "post"] = ...,
+        leaves_only: bool = ...,
+        max_depth: int | None = ...,
+        dotted: bool = ...,
+    ) -> Generator[tuple[tuple | str, Any], None, None]: ...
     def update(self, *args, **kwargs) -> None: ...
     def merge_update(self, *args, **kwargs) -> None: ...
     def setdefault(self, item, default: Incomplete | None = ...): ...
@@ -87,6 +115,11 @@ class Box(dict):
         errors: str = ...,
         **kwargs,
     ) -> Box: ...
+    @staticmethod
+    def compile_path(path: str) -> BoxPath: ...
+    def to_snapshot(self, filename: str | PathLike) -> None: ...
+    @classmethod
+    def open_snapshot(cls, filename: str | PathLike, box_dots: bool = ...) -> SnapshotBox: ...
     def to_yaml(
         self,
         filename: str | PathLike | None = ...,
@@ -11,6 +11,21 @@ from os import PathLike
 from typing import Any
 
 import box
+from box.box import (
+    NO_PATH_MATCH,
+    _cached_box_path,
+    _dotted_index,
+    _fingerprint,
+    _adopt,
+    _last_version,
+    _pickle_tree,
+    _propagate_version,
+    _to_native,
+    _tree_version,
+    _unpickle_tree,
+    _versions,
+    _walk,
+)
 from box.converters import (
     BOX_PARAMETERS,
     _from_csv,
@@ -33,6 +48,10 @@ from box.converters import (
 from box.exceptions import BoxError, BoxTypeError
 
 _list_pos_re = re.compile(r"\[(\d+)\]")
+# Instance attributes that are part of every BoxList, rather than set by users or subclasses
+_list_attributes = frozenset(
+    ("box_options", "box_org_ref", "_dotted_index", "_version", "_parent", "_cached_hash", "_cached_fingerprint")
+)
 
 
 class BoxList(list):
@@ -47,6 +66,11 @@ class BoxList(list):
         obj.box_options = {"box_class": box.Box}
         obj.box_options.update(kwargs)
         obj.box_org_ref = None
+        obj._dotted_index = None
+        obj._version = 0
+        obj._parent = None
+        obj._cached_hash = None
+        obj._cached_fingerprint = None
         return obj
 
     def __init__(self, iterable: Iterable | None = None, box_class: type[box.Box] = box.Box, **box_options):
@@ -54,19 +78,21 @@ class BoxList(list):
         self.box_options["box_class"] = box_class
         self.box_org_ref = iterable
         if iterable:
+            # Filled directly, as a frozen BoxList refuses every change from the start
             for x in iterable:
-                self.append(x)
+                super().append(self._convert(x))
         self.box_org_ref = None
-        if box_options.get("frozen_box"):
 
-            def frozen(*args, **kwargs):
-                raise BoxError("BoxList is frozen")
-
-            for method in ["append", "extend", "insert", "pop", "remove", "reverse", "sort"]:
-                self.__setattr__(method, frozen)
+    def __reduce__(self):
+        return _unpickle_tree, _pickle_tree(self)
 
     def __getitem__(self, item):
         if self.box_options.get("box_dots") and isinstance(item, str) and item.startswith("["):
+            box_path = _cached_box_path(item)
+            if box_path is not None:
+                value = box_path._resolve(self)
+                if value is not NO_PATH_MATCH:
+                    return value
             list_pos = _list_pos_re.search(item)
             value = super().__getitem__(int(list_pos.groups()[0]))
             if len(list_pos.group()) == len(item):
@@ -89,9 +115,11 @@ class BoxList(list):
             list_pos = _list_pos_re.search(key)
             pos = int(list_pos.groups()[0])
             if len(list_pos.group()) == len(key):
+                self._changed()
                 return super().__delitem__(pos)
             if hasattr(self[pos], "__delitem__"):
                 return self[pos].__delitem__(key[len(list_pos.group()) :].lstrip("."))  # type: ignore
+        self._changed()
         super().__delitem__(key)
 
     def __setitem__(self, key, value):
@@ -103,16 +131,33 @@ class BoxList(list):
             if pos >= len(self) and self.box_options.get("default_box"):
                 self.extend([None] * (pos - len(self) + 1))
             if len(list_pos.group()) == len(key):
+                self._changed()
+                self._adopt_child(value)
                 return super().__setitem__(pos, value)
             children = key[len(list_pos.group()) :].lstrip(".")
             if self.box_options.get("default_box"):
+                self._changed()
                 if children[0] == "[":
                     super().__setitem__(pos, box.BoxList(**self.box_options))
                 else:
                     super().__setitem__(pos, self.box_options.get("box_class")(**self.box_options))
+                self._adopt_child(super().__getitem__(pos))
             return super().__getitem__(pos).__setitem__(children, value)
+        self._changed()
+        self._adopt_child(value)
         super().__setitem__(key, value)
 
+    def _changed(self):
+        # What was worked out from the old contents of this list is out of date, see Box.__changed
+        self._dotted_index = None
+        _last_version[0] = self._version = next(_versions)
+        if self._parent is not None:
+            _propagate_version(self._parent, self._version)
+
+    def _adopt_child(self, child):
+        if self.box_options.get("box_track_changes"):
+            _adopt(self, child)
+
     def _is_intact_type(self, obj):
         if self.box_options.get("box_intact_types") and isinstance(obj, self.box_options["box_intact_types"]):
             return True
@@ -123,6 +168,7 @@ class BoxList(list):
             p_object = self.box_options["box_class"](p_object, **self.box_options)
         elif isinstance(p_object, box.Box):
             p_object._box_config.update(self.box_options)
+            p_object._box_config["__set_plan"] = None
         if isinstance(p_object, list) and not self._is_intact_type(p_object):
             p_object = (
                 self
@@ -131,33 +177,86 @@ class BoxList(list):
             )
         elif isinstance(p_object, BoxList):
             p_object.box_options.update(self.box_options)
+        self._adopt_child(p_object)
         return p_object
 
     def append(self, p_object):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
         super().append(self._convert(p_object))
 
     def extend(self, iterable):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
         for item in iterable:
             self.append(item)
 
     def insert(self, index, p_object):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
         super().insert(index, self._convert(p_object))
 
+    # The remaining in place changes only need to be refused when frozen and drop the dotted path index
+
+    def pop(self, index=-1):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        return super().pop(index)
+
+    def remove(self, value):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        super().remove(value)
+
+    def clear(self):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        super().clear()
+
+    def reverse(self):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def __iadd__(self, other):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        if self.box_options.get("frozen_box"):
+            raise BoxError("BoxList is frozen")
+        self._changed()
+        return super().__imul__(other)
+
+    def _dotted_contains(self, item: str) -> bool:
+        """Check a box_dots path starting with a list position, such as "[2].a", without raising or defaulting"""
+        list_pos = _list_pos_re.match(item)
+        if not list_pos or int(list_pos.group(1)) >= len(self):
+            return False
+        children = item[list_pos.end() :].lstrip(".")
+        if not children:
+            return True
+        value = super().__getitem__(int(list_pos.group(1)))
+        if isinstance(value, BoxList):
+            return value._dotted_contains(children)
+        return isinstance(value, dict) and children in value
+
     def _dotted_helper(self) -> list[str]:
-        keys = []
-        for idx, item in enumerate(self):
-            added = False
-            if isinstance(item, box.Box):
-                for key in item.keys(dotted=True):
-                    keys.append(f"[{idx}].{key}")
-                    added = True
-            elif isinstance(item, BoxList):
-                for key in item._dotted_helper():
-                    keys.append(f"[{idx}]{key}")
-                    added = True
-            if not added:
-                keys.append(f"[{idx}]")
-        return keys
+        return list(_dotted_index(self).entries)
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.to_list()})"
@@ -178,23 +277,57 @@ class BoxList(list):
 
     def __hash__(self) -> int:  # type: ignore[override]
         if self.box_options.get("frozen_box"):
-            hashing = 98765
-            hashing ^= hash(tuple(self))
-            return hashing
+            if self._cached_hash is None:
+                self._cached_hash = 98765 ^ hash(tuple(self))
+            return self._cached_hash
         raise BoxTypeError("unhashable type: 'BoxList'")
 
-    def to_list(self) -> list:
-        new_list: list[Any] = []
-        for x in self:
-            if x is self:
-                new_list.append(new_list)
-            elif isinstance(x, box.Box):
-                new_list.append(x.to_dict())
-            elif isinstance(x, BoxList):
-                new_list.append(x.to_list())
-            else:
-                new_list.append(x)
-        return new_list
+    def fingerprint(self) -> str:
+        """
+        Hex digest of the content of the BoxList, stable across processes, see `Box.fingerprint`.
+
+        :return: 32 character hex string
+        """
+        return _fingerprint(self).hex()
+
+    def walk(self, order: str = "pre", leaves_only: bool = False, max_depth: int | None = None, dotted: bool = False):
+        """
+        Iterate over every nested position and value as `(path, value)`, the same as `Box.walk`.
+
+        :param order: "pre" to yield containers before their contents, "post" for after
+        :param leaves_only: only yield values that are not walked into, including empty containers
+        :param max_depth: do not walk into containers at this depth, yielding them as leaves
+        :param dotted: yield the path as a box_dots style string, such as "[0].a.b", instead of a tuple
+        :return: generator of path and value pairs
+        """
+        return _walk(self, order=order, leaves_only=leaves_only, max_depth=max_depth, dotted=dotted)
+
+    def tree_version(self) -> int:
+        """
+        Number that goes up with every change to this BoxList or anything nested in it, see `Box.tree_version`.
+
+        :return: version to give to `changed_since` later
+        """
+        return _tree_version(self)
+
+    def changed_since(self, version: int) -> bool:
+        """
+        Check if this BoxList or anything nested in it changed after `tree_version` returned the version.
+
+        :param version: a version from `tree_version`
+        :return: True if anything changed
+        """
+        return _tree_version(self) > version
+
+    def to_list(self, views: bool = False) -> list:
+        """
+        Turn the BoxList and everything in it back into native python lists and dictionaries,
+        the same as `Box.to_dict`.
+
+        :param views: use read only views of nested Boxes that hold no other Box or BoxList
+        :return: python list
+        """
+        return _to_native(self, views=views)
 
     def to_json(
         self,
@@ -219,7 +352,7 @@ class BoxList(list):
             with open(filename, "w", encoding=encoding, errors=errors) as f:
                 f.write("\n".join(lines))
         else:
-            return _to_json(self.to_list(), filename=filename, encoding=encoding, errors=errors, **json_kwargs)
+            return _to_json(self, filename=filename, encoding=encoding, errors=errors, **json_kwargs)
 
     @classmethod
     def from_json(
@@ -543,5 +676,12 @@ class BoxList(list):
         filename: str | PathLike | None = None,
         encoding: str = "utf-8",
         errors: str = "strict",
+        **kwargs,
     ):
-        return cls(_from_csv(csv_string=csv_string, filename=filename, encoding=encoding, errors=errors))
+        box_args = {}
+        for arg in list(kwargs.keys()):
+            if arg in BOX_PARAMETERS:
+                box_args[arg] = kwargs.pop(arg)
+
+        data = _from_csv(csv_string=csv_string, filename=filename, encoding=encoding, errors=errors, **kwargs)
+        return cls(data, **box_args)
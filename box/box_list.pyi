@@ -6,9 +6,9 @@ from box.converters import (
     toml_write_library as toml_write_library,
     yaml_available as yaml_available,
 )
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
 from os import PathLike as PathLike
-from typing import Any
+from typing import Any, Literal
 
 class BoxList(list):
     def __new__(cls, *args: Any, **kwargs: Any): ...
@@ -24,8 +24,18 @@ class BoxList(list):
     def __copy__(self) -> BoxList: ...
     def __deepcopy__(self, memo: Any | None = ...) -> BoxList: ...
     def __hash__(self) -> int: ...  # type: ignore[override]
-    def to_list(self) -> list: ...
+    def fingerprint(self) -> str: ...
+    def tree_version(self) -> int: ...
+    def changed_since(self, version: int) -> bool: ...
+    def to_list(self, views: bool = ...) -> list: ...
     def _dotted_helper(self) -> list[str]: ...
+    def walk(
+        self,
+        order: Literal["pre", "post"] = ...,
+        leaves_only: bool = ...,
+        max_depth: int | None = ...,
+        dotted: bool = ...,
+    ) -> Generator[tuple[tuple | str, Any], None, None]: ...
     def to_json(
         self,
         filename: str | PathLike = ...,
@@ -91,5 +101,10 @@ class BoxList(list):
     def to_csv(self, filename: str | PathLike = ..., encoding: str = ..., errors: str = ...) -> Any: ...
     @classmethod
     def from_csv(
-        cls, csv_string: str = ..., filename: str | PathLike = ..., encoding: str = ..., errors: str = ...
+        cls,
+        csv_string: str = ...,
+        filename: str | PathLike = ...,
+        encoding: str = ...,
+        errors: str = ...,
+        **kwargs: Any,
     ) -> Any: ...
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import csv
 import json
+import re
 from collections.abc import Callable
 from io import StringIO
 from os import PathLike
@@ -50,6 +51,7 @@ __all__ = [
     "_from_csv",
     "_from_msgpack",
     "_from_toon",
+    "_select_json",
 ]
 
 
@@ -134,6 +136,7 @@ BOX_PARAMETERS = (
     "box_recast",
     "box_class",
     "box_namespace",
+    "box_track_changes",
 )
 
 
@@ -189,6 +192,200 @@ def _from_json(
     return data
 
 
+_json_select_re = re.compile(r"\[(\d+|\*)\]|([^.\[\]]+)")
+# a whole select path, so empty keys such as in "a..b" or "a." are refused instead of skipped
+_json_select_path_re = re.compile(r"(?:[^.\[\]]+|\[(?:\d+|\*)\])(?:\.[^.\[\]]+|\[(?:\d+|\*)\])*")
+_json_special_re = re.compile(r'["{}\[\]]')
+_json_string_body_re = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_json_scalar_re = re.compile(r"[^\s,\]}]*")
+
+# a sentinel object for `[*]` in a select path, matching every item of a list
+JSON_WILDCARD = object()
+
+
+class _JsonStream:
+    """
+    Minimal incremental JSON tokenizer that walks a file chunk by chunk, skipping over
+    anything that is not on the selected path and only decoding the selected values.
+    """
+
+    def __init__(self, f, chunk_size: int = 65536):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.captured: list[str] | None = None
+        self.capture_from = 0
+
+    def fill(self) -> bool:
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            return False
+        if self.captured is not None:
+            self.captured.append(self.buffer[self.capture_from : self.pos])
+            self.capture_from = 0
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise BoxError("Unexpected end of JSON data")
+
+    def next(self) -> str:
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def expect(self, expected: str):
+        char = self.next()
+        if char != expected:
+            raise BoxError(f"Invalid JSON data, expected '{expected}' but found '{char}'")
+
+    def skip_string(self):
+        # Called just past the opening quote
+        while True:
+            self.pos = _json_string_body_re.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buffer) and self.buffer[self.pos] == '"':
+                self.pos += 1
+                return
+            if not self.fill():
+                raise BoxError("Unterminated string in JSON data")
+
+    def skip_container(self):
+        # Called just past the opening bracket
+        depth = 1
+        while depth:
+            match = _json_special_re.search(self.buffer, self.pos)
+            if not match:
+                self.pos = len(self.buffer)
+                if not self.fill():
+                    raise BoxError("Unexpected end of JSON data")
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self.skip_string()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+
+    def skip_value(self):
+        char = self.next()
+        if char == '"':
+            self.skip_string()
+        elif char in "{[":
+            self.skip_container()
+        else:
+            while True:
+                self.pos = _json_scalar_re.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+                if self.pos < len(self.buffer) or not self.fill():
+                    return
+
+    def read_string(self) -> str:
+        self.peek()
+        start = self.pos
+        self.captured, self.capture_from = [], start
+        self.expect('"')
+        self.skip_string()
+        return json.loads(self.end_capture())
+
+    def read_value(self, **kwargs) -> Any:
+        self.peek()
+        self.captured, self.capture_from = [], self.pos
+        self.skip_value()
+        return json.loads(self.end_capture(), **kwargs)
+
+    def end_capture(self) -> str:
+        self.captured.append(self.buffer[self.capture_from : self.pos])  # type: ignore[union-attr]
+        text = "".join(self.captured)  # type: ignore[arg-type]
+        self.captured = None
+        return text
+
+    def select(self, path: list, finish: bool = False, **kwargs):
+        """
+        Yield every value matching `path` from the current position.
+
+        :param path: remaining keys, indexes or JSON_WILDCARD to follow
+        :param finish: consume the rest of the current container even after a match, needed when
+            an enclosing wildcard will keep reading
+        """
+        if not path:
+            yield self.read_value(**kwargs)
+            return
+        segment, rest = path[0], path[1:]
+        char = self.peek()
+        if char == "{" and isinstance(segment, str):
+            self.pos += 1
+            while self.peek() != "}":
+                key = self.read_string()
+                self.expect(":")
+                if key == segment:
+                    yield from self.select(rest, finish, **kwargs)
+                    if not finish:
+                        return
+                else:
+                    self.skip_value()
+                if self.peek() == ",":
+                    self.pos += 1
+            self.pos += 1
+        elif char == "[" and (segment is JSON_WILDCARD or isinstance(segment, int)):
+            self.pos += 1
+            index = 0
+            while self.peek() != "]":
+                if segment is JSON_WILDCARD:
+                    yield from self.select(rest, True, **kwargs)
+                elif index == segment:
+                    yield from self.select(rest, finish, **kwargs)
+                    if not finish:
+                        return
+                else:
+                    self.skip_value()
+                index += 1
+                if self.peek() == ",":
+                    self.pos += 1
+            self.pos += 1
+        else:
+            self.skip_value()
+
+
+def _select_json(
+    filename: str | PathLike,
+    select: str,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    **kwargs,
+) -> tuple[bool, list]:
+    """
+    Stream through a JSON file and decode only the values found at the `select` path.
+
+    :param filename: JSON file to read
+    :param select: box_dots style path, such as "payload.items" or "payload.items[*].id"
+    :param encoding: File encoding
+    :param errors: How to handle encoding errors
+    :param kwargs: parameters to pass to `json.loads` for the selected values
+    :return: if the path contained a wildcard, and the list of matched values
+    """
+    if not _json_select_path_re.fullmatch(select):
+        raise BoxError(f'Invalid select path "{select}"')
+    path: list[Any] = []
+    for index, key in _json_select_re.findall(select):
+        if key:
+            path.append(key)
+        else:
+            path.append(JSON_WILDCARD if index == "*" else int(index))
+    _exists(filename)
+    with open(filename, "r", encoding=encoding, errors=errors) as f:
+        matches = list(_JsonStream(f).select(path, **kwargs))
+    return JSON_WILDCARD in path, matches
+
+
 def _to_yaml(
     obj,
     filename: str | PathLike | None = None,
@@ -397,7 +594,7 @@ def _from_csv(
 ):
     if csv_string:
         with StringIO(csv_string) as cs:
-            reader = csv.DictReader(cs)
+            reader = csv.DictReader(cs, **kwargs)
             return [row for row in reader]
     _exists(filename)  # type: ignore
     with open(filename, "r", encoding=encoding, errors=errors, newline="") as f:  # type: ignore
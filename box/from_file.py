@@ -2,16 +2,28 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import codecs
+import csv
+import re
 import sys
 from collections.abc import Callable
+from functools import partial
 from json import JSONDecodeError
 from os import PathLike
 from pathlib import Path
 
 from box.box import Box
 from box.box_list import BoxList
-from box.converters import msgpack_available, toon_available, toml_read_library, yaml_available, toml_decode_error
-from box.exceptions import BoxError
+from box.converters import (
+    BOX_PARAMETERS,
+    _select_json,
+    msgpack_available,
+    toon_available,
+    toml_read_library,
+    yaml_available,
+    toml_decode_error,
+)
+from box.exceptions import BoxError, BoxKeyError
 
 try:
     from ruamel.yaml import YAMLError
@@ -34,6 +46,27 @@ except ImportError:
 
 __all__ = ["box_from_file", "box_from_string"]
 
+# Only this much of a file is read to guess its type when the suffix is missing or unknown
+_sniff_size = 4096
+
+# Checked in order, UTF-32 LE must come before UTF-16 LE as they share the same first two bytes
+_bom_encodings = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# msgpack type bytes for maps (fixmap, map16, map32) and arrays (fixarray, array16, array32),
+# none of which can start a UTF-8 document
+_msgpack_maps = frozenset([*range(0x80, 0x90), 0xDE, 0xDF])
+_msgpack_arrays = frozenset([*range(0x90, 0xA0), 0xDC, 0xDD])
+
+_toml_table_re = re.compile(r"^\[\[?[\w\-.\"' ]+\]\]?\s*(#.*)?$")
+_toml_pair_re = re.compile(r"^[\w\-.\"' ]+=")
+_yaml_line_re = re.compile(r"^(-(\s|$)|(\"[^\"]*\"|'[^']*'|[^\s,\"'{\[#][^,:]*?)\s*:(\s|$))")
+
 
 def _to_json(file, encoding, errors, **kwargs):
     try:
@@ -44,6 +77,33 @@ def _to_json(file, encoding, errors, **kwargs):
         return BoxList.from_json(filename=file, encoding=encoding, errors=errors, **kwargs)
 
 
+def _to_json_list(file, encoding, errors, **kwargs):
+    try:
+        return BoxList.from_json(filename=file, encoding=encoding, errors=errors, **kwargs)
+    except JSONDecodeError:
+        raise BoxError("File is not JSON as expected")
+
+
+def _to_json_selected(file, encoding, errors, select, **kwargs):
+    box_args = {}
+    for arg in kwargs.copy():
+        if arg in BOX_PARAMETERS:
+            box_args[arg] = kwargs.pop(arg)
+    try:
+        wildcard, matches = _select_json(file, select, encoding=encoding, errors=errors, **kwargs)
+    except JSONDecodeError:
+        raise BoxError("File is not JSON as expected")
+    if wildcard:
+        return BoxList(matches, **box_args)
+    if not matches:
+        raise BoxKeyError(f'"{select}" was not found in "{file}"')
+    if isinstance(matches[0], dict):
+        return Box(matches[0], **box_args)
+    if isinstance(matches[0], list):
+        return BoxList(matches[0], **box_args)
+    raise BoxError(f'"{select}" is a {type(matches[0]).__name__}, not an object or array')
+
+
 def _to_csv(file, encoding, errors, **kwargs):
     return BoxList.from_csv(filename=file, encoding=encoding, errors=errors, **kwargs)
 
@@ -81,6 +141,15 @@ def _to_msgpack(file, _, __, **kwargs):
         return BoxList.from_msgpack(filename=file, **kwargs)
 
 
+def _to_msgpack_list(file, _, __, **kwargs):
+    if not msgpack_available:
+        raise BoxError(f'File "{file}" is msgpack but no package is available to open it. Please install "msgpack"')
+    try:
+        return BoxList.from_msgpack(filename=file, **kwargs)
+    except (UnpackException, ValueError):
+        raise BoxError("File is not msgpack as expected")
+
+
 def _to_toon(file, encoding, errors, **kwargs):
     if not toon_available:
         raise BoxError(f'File "{file}" is toon but no package is available to open it. Please install "toon_format"')
@@ -106,20 +175,83 @@ converters = {
 }  # type: dict[str, Callable]
 
 
+def _sniff_converter(file: Path, encoding: str) -> tuple[Callable | None, str]:
+    """
+    Guess the format of a file from its first few KB, so the right converter is picked once
+    instead of trying to parse the whole file as each format in turn.
+
+    :param file: Location of file
+    :param encoding: File encoding, overridden if the file starts with a BOM
+    :return: converter (None if the format could not be detected) and the encoding to open the file with
+    """
+    with open(file, "rb") as f:
+        head = f.read(_sniff_size)
+
+    for bom, bom_encoding in _bom_encodings:
+        if head.startswith(bom):
+            encoding = bom_encoding
+            break
+    else:
+        if head[:1] and head[0] in _msgpack_maps:
+            return _to_msgpack, encoding
+        if head[:1] and head[0] in _msgpack_arrays:
+            return _to_msgpack_list, encoding
+
+    try:
+        text = codecs.getincrementaldecoder(encoding)().decode(head)
+    except (UnicodeDecodeError, LookupError):
+        return None, encoding
+
+    lines = [line.strip() for line in text.splitlines()]
+    if len(head) == _sniff_size:
+        # The last line is most likely cut short
+        lines = lines[:-1]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    if not lines:
+        return None, encoding
+
+    first = lines[0]
+    if first.startswith("{"):
+        return _to_json, encoding
+    if _toml_table_re.match(first) and any(_toml_pair_re.match(line) for line in lines[1:]):
+        return _to_toml, encoding
+    if first.startswith("["):
+        return _to_json_list, encoding
+    if first.startswith(("---", "%YAML")):
+        return _to_yaml, encoding
+    # Before the YAML check, as a TOML string value may hold a ": " of its own
+    if _toml_pair_re.match(first):
+        return _to_toml, encoding
+    if _yaml_line_re.match(first):
+        return _to_yaml, encoding
+    try:
+        dialect = csv.Sniffer().sniff("\n".join(lines), delimiters=",;\t|")
+    except csv.Error:
+        return None, encoding
+    return partial(_to_csv, delimiter=dialect.delimiter), encoding
+
+
 def box_from_file(
     file: str | PathLike,
     file_type: str | None = None,
     encoding: str = "utf-8",
     errors: str = "strict",
+    select: str | None = None,
     **kwargs,
 ) -> Box | BoxList:
     """
     Loads the provided file and tries to parse it into a Box or BoxList object as appropriate.
 
+    If the file has no suffix, an unknown suffix, or `file_type` is "auto", the type is
+    detected from the first few KB of the file instead.
+
     :param file: Location of file
     :param encoding: File encoding
     :param errors: How to handle encoding errors
-    :param file_type: manually specify file type: json, toml or yaml
+    :param file_type: manually specify file type: json, toml, yaml or auto
+    :param select: JSON only, box_dots style path of the part of the file to load, such as "payload.items".
+        The file is streamed and everything else is skipped. Use `[*]` to collect from every
+        item of a list into a BoxList, such as "payload.items[*].id"
     :return: Box or BoxList
     """
 
@@ -127,11 +259,22 @@ def box_from_file(
         file = Path(file)
     if not file.exists():
         raise BoxError(f'file "{file}" does not exist')
-    file_type = file_type or file.suffix
+    if file_type is None:
+        file_type = file.suffix if file.suffix.lower().lstrip(".") in converters else "auto"
     file_type = file_type.lower().lstrip(".")
-    if file_type.lower() in converters:
-        return converters[file_type.lower()](file, encoding, errors, **kwargs)  # type: ignore
-    raise BoxError(f'"{file_type}" is an unknown type. Please use either csv, toon, toml, msgpack, yaml or json')
+    if file_type in converters:
+        converter = converters[file_type]
+    elif file_type == "auto":
+        converter, encoding = _sniff_converter(file, encoding)
+        if converter is None:
+            raise BoxError(f'Could not detect the type of "{file}". Please specify file_type')
+    else:
+        raise BoxError(f'"{file_type}" is an unknown type. Please use either csv, toon, toml, msgpack, yaml or json')
+    if select is not None:
+        if converter not in (_to_json, _to_json_list):
+            raise BoxError("select is only supported for JSON files")
+        return _to_json_selected(file, encoding, errors, select, **kwargs)
+    return converter(file, encoding, errors, **kwargs)  # type: ignore
 
 
 def box_from_string(content: str, string_type: str = "json") -> Box | BoxList:
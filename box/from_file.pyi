@@ -8,6 +8,7 @@ def box_from_file(
     file_type: str = ...,
     encoding: str = ...,
     errors: str = ...,
+    select: str | None = ...,
     **kwargs: Any,
 ) -> Box | BoxList: ...
 def box_from_string(
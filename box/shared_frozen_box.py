@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017-2026 - Chris Griffith - MIT License
+from __future__ import annotations
+
+import io
+import os
+import sys
+from collections.abc import Mapping
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from box.exceptions import BoxError
+from box.snapshot import SnapshotBox, _header, _load_snapshot, _SnapshotWriter, MAGIC
+
+__all__ = ["SharedFrozenBox"]
+
+# Segments stay mapped until closed, as nested views only hold the buffer and not the segment itself
+_segments: dict[str, SharedMemory] = {}
+
+
+def _attach_segment(name: str) -> SharedMemory:
+    if name in _segments:
+        return _segments[name]
+    if sys.version_info >= (3, 13):
+        # Only the creating process should clean up the segment
+        shm = SharedMemory(name=name, track=False)
+    else:
+        shm = SharedMemory(name=name)
+        if os.name == "posix":
+            # Older versions register every attached segment, so the first worker to exit would destroy it
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    _segments[name] = shm
+    return shm
+
+
+class SharedFrozenBox(SnapshotBox):
+    """
+    Read-only Box stored once in a `multiprocessing.shared_memory` segment. Every process
+    attached to the segment reads the same memory and only decodes the values it accesses,
+    so memory use does not grow with the number of worker processes.
+
+    The creating process owns the segment and should call `segment_unlink` once all workers are done.
+    Passing a SharedFrozenBox to another process (pickling) attaches to the segment by name.
+    Segment methods are prefixed with `segment_` so they do not hide keys of the data.
+
+    :param data: dictionary or Box to store
+    :param name: optional name for the shared memory segment
+    :param box_dots: access nested values by period separated keys in string
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, data: Mapping, name: str | None = None, box_dots: bool = False):
+        if not isinstance(data, Mapping):
+            raise BoxError(f"SharedFrozenBox requires a dictionary, not a {type(data).__name__}")
+        with io.BytesIO() as stream:
+            stream.write(_header.pack(MAGIC, 0))
+            root = _SnapshotWriter(stream, _header.size).write(data)
+            stream.seek(0)
+            stream.write(_header.pack(MAGIC, root))
+            payload = stream.getbuffer()
+            shm = SharedMemory(name=name, create=True, size=len(payload))
+            shm.buf[: len(payload)] = payload
+            del payload
+        _segments[shm.name] = shm
+        self._name = shm.name
+        super().__init__(shm.buf, root, box_dots)
+
+    @classmethod
+    def attach(cls, name: str, box_dots: bool = False) -> SharedFrozenBox:
+        """
+        Attach to a segment created by another SharedFrozenBox.
+
+        :param name: name of the shared memory segment
+        :param box_dots: access nested values by period separated keys in string
+        :return: SharedFrozenBox reading from the segment
+        """
+        shm = _attach_segment(name)
+        root = _load_snapshot(shm.buf)
+        if not isinstance(root, SnapshotBox):
+            raise BoxError(f"Shared memory segment {name} does not hold a dictionary")
+        obj = object.__new__(cls)
+        obj._name = name
+        SnapshotBox.__init__(obj, shm.buf, root._offset, box_dots)
+        return obj
+
+    @property
+    def segment_name(self) -> str:
+        """Name of the shared memory segment, to `attach` to from other processes."""
+        return self._name
+
+    def segment_close(self):
+        """Detach this process from the segment, no values can be read afterwards."""
+        shm = _segments.pop(self._name, None)
+        if shm is not None:
+            shm.close()
+
+    def segment_unlink(self):
+        """Close and destroy the segment, call once from the creating process when every worker is done."""
+        shm = _segments.get(self._name) or _attach_segment(self._name)
+        self.segment_close()
+        if sys.version_info < (3, 13) and os.name == "posix":
+            # unlink always unregisters the segment, which may have been unregistered by an attaching process
+            resource_tracker.register(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        shm.unlink()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.segment_close()
+
+    def __reduce__(self):
+        return self.__class__.attach, (self._name, self._box_dots)
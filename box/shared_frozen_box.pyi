@@ -0,0 +1,13 @@
+from box.snapshot import SnapshotBox as SnapshotBox
+from collections.abc import Mapping
+from typing import Any
+
+class SharedFrozenBox(SnapshotBox):
+    def __init__(self, data: Mapping, name: str | None = ..., box_dots: bool = ...) -> None: ...
+    @classmethod
+    def attach(cls, name: str, box_dots: bool = ...) -> SharedFrozenBox: ...
+    @property
+    def segment_name(self) -> str: ...
+    def segment_close(self) -> None: ...
+    def segment_unlink(self) -> None: ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
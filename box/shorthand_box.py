@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from box.box import Box
+from box.box import Box, _last_version, _tree_version
 
 __all__ = ["SBox", "DDBox"]
 
@@ -29,19 +29,35 @@ class SBox(Box):
 
     @property
     def dict(self) -> dict:
+        # Always a new copy, as the caller may change it
         return self.to_dict()
 
     @property
     def json(self) -> str:
-        return self.to_json()
+        return self._serialized("json", self.to_json)
 
     @property
     def yaml(self) -> str:
-        return self.to_yaml()
+        return self._serialized("yaml", self.to_yaml)
 
     @property
     def toml(self) -> str:
-        return self.to_toml()
+        return self._serialized("toml", self.to_toml)
+
+    def _serialized(self, name: str, serialize) -> str:
+        """
+        Remember each serialized form until anything in the Box changes, for good if it is frozen.
+        Only changes made through Box and BoxList objects are seen, not to other values stored in them.
+        """
+        cache = self._box_config.get("__serialized")
+        if cache is None or (cache[0] != _last_version[0] and not self._box_config["frozen_box"]):
+            # Something somewhere changed since, so check if it was in this Box
+            version = _tree_version(self)
+            forms = cache[2] if cache is not None and cache[1] == version else {}
+            cache = self._box_config["__serialized"] = (_last_version[0], version, forms)
+        if name not in cache[2]:
+            cache[2][name] = serialize()
+        return cache[2][name]
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self})"
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017-2026 - Chris Griffith - MIT License
+"""
+Read-only Box data stored in a flat binary format with an offset index, so it can be
+memory mapped and only the parts actually accessed are ever decoded.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Iterator, Mapping, Sequence
+from hashlib import blake2b
+from os import PathLike
+from typing import Any
+
+from box.box import Box, _parse_box_dots
+from box.box_list import BoxList, _list_pos_re
+from box.exceptions import BoxError, BoxKeyError, BoxTypeError
+
+__all__ = ["SnapshotBox", "SnapshotBoxList"]
+
+# Layout, all integers are little endian unsigned 64-bit:
+#   header: MAGIC, root offset
+#   dict:   b"D", count, count * (key offset, value offset), count * (key hash, entry index) sorted by hash
+#   list:   b"L", count, count * value offset, also used for tuples
+#   value:  b"V", length, pickled value
+#   key:    length, b"s" + utf-8 for strings or b"p" + pickled key for anything else
+MAGIC = b"BOXSNAP\x01"
+_header = struct.Struct("<8sQ")
+_int = struct.Struct("<Q")
+_pair = struct.Struct("<QQ")
+
+
+def _encode_key(key: Any) -> bytes:
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8", "surrogatepass")
+    return b"p" + pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_key(data) -> Any:
+    if data[:1] == b"s":
+        return bytes(data[1:]).decode("utf-8", "surrogatepass")
+    return pickle.loads(data[1:])
+
+
+def _key_hash(encoded_key: bytes) -> int:
+    return int.from_bytes(blake2b(encoded_key, digest_size=8).digest(), "little")
+
+
+class _SnapshotWriter:
+    def __init__(self, f, offset: int):
+        self.f = f
+        self.offset = offset
+        self.memo: dict[int, int] = {}
+        self.in_progress: set[int] = set()
+
+    def write(self, obj) -> int:
+        if isinstance(obj, (dict, list)) or type(obj) is tuple:
+            # Tuples are stored as lists, so the tuples of Boxes in frozen Boxes stay lazily decoded
+            if id(obj) in self.memo:
+                # Shared subtrees are only written once
+                return self.memo[id(obj)]
+            if id(obj) in self.in_progress:
+                raise BoxError("Cannot snapshot recursive structures")
+            self.in_progress.add(id(obj))
+            offset = self.write_dict(obj) if isinstance(obj, dict) else self.write_list(obj)  # type: ignore[arg-type]
+            self.in_progress.discard(id(obj))
+            self.memo[id(obj)] = offset
+            return offset
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        return self.append(b"V" + _int.pack(len(data)) + data)
+
+    def append(self, data: bytes) -> int:
+        offset = self.offset
+        self.f.write(data)
+        self.offset += len(data)
+        return offset
+
+    def write_dict(self, obj: dict) -> int:
+        entries = []
+        hashes = []
+        for index, (key, value) in enumerate(obj.items()):
+            value_offset = self.write(value)
+            encoded_key = _encode_key(key)
+            key_offset = self.append(_int.pack(len(encoded_key)) + encoded_key)
+            entries.append(_pair.pack(key_offset, value_offset))
+            hashes.append((_key_hash(encoded_key), index))
+        hashes.sort()
+        return self.append(b"".join([b"D", _int.pack(len(entries)), *entries, *(_pair.pack(*pair) for pair in hashes)]))
+
+    def write_list(self, obj: list | tuple) -> int:
+        offsets = [self.write(value) for value in obj]
+        return self.append(b"".join([b"L", _int.pack(len(offsets)), *(_int.pack(offset) for offset in offsets)]))
+
+
+def _write_snapshot(obj: dict | list, filename: str | PathLike):
+    with open(filename, "wb") as f:
+        f.write(_header.pack(MAGIC, 0))
+        root = _SnapshotWriter(f, _header.size).write(obj)
+        f.seek(0)
+        f.write(_header.pack(MAGIC, root))
+
+
+def _decode(buffer, offset: int, box_dots: bool):
+    node_type = buffer[offset : offset + 1]
+    try:
+        if node_type == b"D":
+            return SnapshotBox(buffer, offset, box_dots)
+        if node_type == b"L":
+            return SnapshotBoxList(buffer, offset, box_dots)
+        if node_type == b"V":
+            (length,) = _int.unpack_from(buffer, offset + 1)
+            start = offset + 1 + _int.size
+            if start + length > len(buffer):
+                raise struct.error("value runs past the end of the data")
+            return pickle.loads(buffer[start : start + length])
+    except struct.error as err:
+        raise BoxError(f"Corrupt snapshot, node at offset {offset} is truncated") from err
+    raise BoxError(f"Corrupt snapshot, unknown node type {node_type!r} at offset {offset}")
+
+
+def _load_snapshot(buffer, box_dots: bool = False):
+    """Return the lazily decoded root of snapshot data held in any buffer, such as an mmap."""
+    if len(buffer) < _header.size:
+        raise BoxError("Data is too short to be a Box snapshot")
+    magic, root = _header.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise BoxError("Data is not a Box snapshot")
+    if not _header.size <= root < len(buffer):
+        raise BoxError("Corrupt snapshot, it is truncated or its root offset is out of range")
+    return _decode(buffer, root, box_dots)
+
+
+def _open_snapshot(filename: str | PathLike, box_dots: bool = False):
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _header.size:
+            # An empty file cannot even be memory mapped
+            raise BoxError(f"{filename} is too short to be a Box snapshot")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _load_snapshot(buffer, box_dots=box_dots)
+    except BoxError:
+        buffer.close()
+        raise
+
+
+def _to_native(value):
+    if isinstance(value, SnapshotBox):
+        return value.to_dict()
+    if isinstance(value, SnapshotBoxList):
+        return value.to_list()
+    return value
+
+
+class SnapshotBox(Mapping):
+    """
+    Read-only dictionary view into snapshot data. Keys are found through a hash index
+    and values are only decoded when accessed, nested dictionaries and lists are
+    returned as further views.
+
+    Used as a context manager, a snapshot opened from a file is unmapped on exit,
+    after which neither it nor any view taken from it can be read. Otherwise the
+    file stays mapped until every view of it is garbage collected.
+    """
+
+    __slots__ = ("_buffer", "_offset", "_count", "_box_dots")
+
+    def __init__(self, buffer, offset: int, box_dots: bool = False):
+        self._buffer = buffer
+        self._offset = offset
+        (self._count,) = _int.unpack_from(buffer, offset + 1)
+        self._box_dots = box_dots
+
+    def _entry(self, index: int) -> tuple[int, int]:
+        return _pair.unpack_from(self._buffer, self._offset + 1 + _int.size + index * _pair.size)
+
+    def _key(self, key_offset: int) -> bytes:
+        (length,) = _int.unpack_from(self._buffer, key_offset)
+        start = key_offset + _int.size
+        return self._buffer[start : start + length]
+
+    def _find(self, key) -> int | None:
+        try:
+            encoded_key = _encode_key(key)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        target = _key_hash(encoded_key)
+        hash_table = self._offset + 1 + _int.size + self._count * _pair.size
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if _pair.unpack_from(self._buffer, hash_table + mid * _pair.size)[0] < target:
+                low = mid + 1
+            else:
+                high = mid
+        while low < self._count:
+            key_hash, index = _pair.unpack_from(self._buffer, hash_table + low * _pair.size)
+            if key_hash != target:
+                break
+            key_offset, value_offset = self._entry(index)
+            if self._key(key_offset) == encoded_key:
+                return value_offset
+            low += 1
+        return None
+
+    def __getitem__(self, item):
+        value_offset = self._find(item)
+        if value_offset is not None:
+            return _decode(self._buffer, value_offset, self._box_dots)
+        if self._box_dots and isinstance(item, str) and ("." in item or "[" in item):
+            try:
+                first_item, children = _parse_box_dots(self, item)
+            except BoxError:
+                raise BoxKeyError(item) from None
+            if first_item in self:
+                child = self[first_item]
+                if isinstance(child, (SnapshotBox, SnapshotBoxList)):
+                    return child[children]
+        raise BoxKeyError(item)
+
+    def __getattr__(self, item):
+        if item.startswith("__") and item.endswith("__"):
+            raise AttributeError(item)
+        try:
+            return self[item]
+        except KeyError:
+            raise BoxKeyError(f"'{self.__class__.__name__}' object has no attribute '{item}'") from None
+
+    def __setattr__(self, key, value):
+        if key.startswith("_"):
+            # Internal slots only, anything else has nowhere to go
+            return object.__setattr__(self, key, value)
+        raise BoxError("Snapshot Box is read only")
+
+    def __iter__(self) -> Iterator:
+        for index in range(self._count):
+            yield _decode_key(self._key(self._entry(index)[0]))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def __reduce__(self):
+        raise BoxTypeError(f"{self.__class__.__name__} cannot be pickled, use to_dict or to_box first")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # A context manager rather than a close method, which would hide a "close" key
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def to_dict(self) -> dict:
+        """Decode this view and everything under it into a native python dictionary."""
+        return {key: _to_native(value) for key, value in self.items()}
+
+    def to_box(self, **box_options) -> Box:
+        """Decode this view and everything under it into a regular Box."""
+        return Box(self.to_dict(), **box_options)
+
+
+class SnapshotBoxList(Sequence):
+    """Read-only list view into snapshot data, items are decoded only when accessed."""
+
+    __slots__ = ("_buffer", "_offset", "_count", "_box_dots")
+
+    def __init__(self, buffer, offset: int, box_dots: bool = False):
+        self._buffer = buffer
+        self._offset = offset
+        (self._count,) = _int.unpack_from(buffer, offset + 1)
+        self._box_dots = box_dots
+
+    def __getitem__(self, item):
+        if self._box_dots and isinstance(item, str) and item.startswith("["):
+            list_pos = _list_pos_re.search(item)
+            if not list_pos:
+                raise BoxKeyError(item)
+            # Like Box lookups, a path that leads nowhere is a missing key, so `in` and `get` work
+            try:
+                value = self[int(list_pos.groups()[0])]
+            except IndexError:
+                raise BoxKeyError(item) from None
+            if len(list_pos.group()) == len(item):
+                return value
+            if not isinstance(value, (SnapshotBox, SnapshotBoxList)):
+                raise BoxKeyError(item)
+            return value[item[len(list_pos.group()) :].lstrip(".")]
+        if isinstance(item, slice):
+            return [self[index] for index in range(self._count)[item]]
+        if not isinstance(item, int):
+            raise BoxTypeError(f"list indices must be integers or slices, not {type(item).__name__}")
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("list index out of range")
+        (value_offset,) = _int.unpack_from(self._buffer, self._offset + 1 + _int.size * (item + 1))
+        return _decode(self._buffer, value_offset, self._box_dots)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_list()})"
+
+    def __reduce__(self):
+        raise BoxTypeError(f"{self.__class__.__name__} cannot be pickled, use to_list or to_box_list first")
+
+    def to_list(self) -> list:
+        """Decode this view and everything under it into a native python list."""
+        return [_to_native(value) for value in self]
+
+    def to_box_list(self, **box_options) -> BoxList:
+        """Decode this view and everything under it into a regular BoxList."""
+        return BoxList(self.to_list(), **box_options)
@@ -0,0 +1,22 @@
+from box.box import Box as Box
+from box.box_list import BoxList as BoxList
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+class SnapshotBox(Mapping):
+    def __init__(self, buffer: Any, offset: int, box_dots: bool = ...) -> None: ...
+    def __getitem__(self, item: Any) -> Any: ...
+    def __getattr__(self, item: str) -> Any: ...
+    def __iter__(self) -> Iterator: ...
+    def __len__(self) -> int: ...
+    def to_dict(self) -> dict: ...
+    def to_box(self, **box_options: Any) -> Box: ...
+    def __enter__(self) -> SnapshotBox: ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+class SnapshotBoxList(Sequence):
+    def __init__(self, buffer: Any, offset: int, box_dots: bool = ...) -> None: ...
+    def __getitem__(self, item: Any) -> Any: ...
+    def __len__(self) -> int: ...
+    def to_list(self) -> list: ...
+    def to_box_list(self, **box_options: Any) -> BoxList: ...
@@ -2,13 +2,17 @@
 # -*- coding: utf-8 -*-
 # Test files gathered from json.org and yaml.org
 import copy
+import gc
 import json
 import os
 import pickle
 import platform
 import shutil
+import weakref
+from collections import namedtuple
 from multiprocessing import Queue
 from pathlib import Path
+from types import MappingProxyType
 from io import StringIO
 from test.common import (
     data_json_file,
@@ -28,9 +32,11 @@ import pytest
 from ruamel.yaml import YAML
 
 from box import Box, BoxError, BoxKeyError, BoxList, ConfigBox, SBox, DDBox
-from box.box import _get_dot_paths, _camel_killer, _recursive_tuples  # type: ignore
+from box.box import _get_dot_paths, _camel_killer, _default_box_attr_conventions, _recursive_tuples  # type: ignore
 from box.converters import BOX_PARAMETERS
 
+Point = namedtuple("Point", "x y")
+
 
 def mp_queue_test(q):
     bx = q.get()
@@ -59,6 +65,45 @@ class TestBox:
         assert Box(camel_killer_box=True)._safe_attr("BAD!KEY!2") == "bad_key_2"
         assert Box()._safe_attr((5, 6, 7)) == "x5_6_7"
         assert Box()._safe_attr(356) == "x356"
+        assert Box()._safe_attr(True) == "xTrue"
+        assert Box()._safe_attr(1) == "x1"
+
+    def test_safe_keys_lazy(self):
+        bx = Box({"First Name": "Ada", "Last-Name": "Lovelace"})
+        assert bx._box_config["__safe_keys"] is None
+        assert bx.First_Name == "Ada"
+        assert bx._box_config["__safe_keys"] == {"First_Name": "First Name", "Last_Name": "Last-Name"}
+        bx["Middle Name"] = "King"
+        assert bx.Middle_Name == "King"
+        del bx["Middle Name"]
+        assert "Middle_Name" not in bx._box_config["__safe_keys"]
+        with pytest.raises(AttributeError):
+            bx.Middle_Name
+        del bx.Last_Name
+        assert bx == {"First Name": "Ada"}
+        bx.First_Name = "Augusta"
+        assert bx == {"First Name": "Augusta"}
+        with pytest.raises(BoxError):
+            Box({"a b": 1, "a-b": 2}, box_duplicates="error")
+
+    def test_set_plan(self):
+        plain = Box(a=1)
+        assert plain._box_config["__set_plan"] is Box._Box__set_plain
+        plain["b c"] = {"d": 2}
+        assert plain.b_c.d == 2
+        assert plain.b_c._box_config["__set_plan"] is Box._Box__set_plain
+        dotted = Box(a={"b": 1}, box_dots=True)
+        assert dotted._box_config["__set_plan"] is Box._Box__set_full
+        dotted["a.b"] = 2
+        assert dotted.a.b == 2
+
+        inner = Box(a={"b": 1})
+        bl = BoxList([inner], box_dots=True, box_intact_types=(Box,))
+        assert bl[0] is inner
+        inner["a.b"] = 3
+        assert inner == {"a": {"b": 3}}
+        with pytest.raises(BoxError):
+            Box(a=1, frozen_box=True)["b"] = 2
 
     def test_camel_killer(self):
         assert _camel_killer("CamelCase") == "camel_case"
@@ -90,6 +135,57 @@ class TestBox:
         assert "big_camel" not in bx1
         assert len(bx1.keys()) == 0
 
+        bx1["CamelOne"] = 1
+        bx1["camel_two"] = 2
+        del bx1["CamelOne"]
+        del bx1["CamelTwo"]
+        assert len(bx1.keys()) == 0
+        with pytest.raises(KeyError):
+            del bx1["CamelThree"]
+
+    def test_eager_normalizing(self):
+        bx = Box(
+            {"FirstName": "Ada", "Home Address": {"ZipCode": 1}, "items": [{"ItemId": 3}]},
+            camel_killer_box="eager",
+            conversion_box="eager",
+        )
+        assert bx == {"first_name": "Ada", "home_address": {"zip_code": 1}, "items": [{"item_id": 3}]}
+        bx.LastName = "Lovelace"
+        assert bx.last_name == "Lovelace"
+
+        with pytest.raises(BoxError):
+            Box({"FooBar": 1, "foo_bar": 2}, camel_killer_box="eager", conversion_box=False, box_duplicates="error")
+        with pytest.warns(UserWarning):
+            assert Box({"a b": 1, "a-b": 2}, conversion_box="eager", box_duplicates="warn") == {"a_b": 2}
+        assert Box({"a b": 1, "a-b": 2}, conversion_box="eager") == {"a_b": 2}
+        updated = Box({"FooBar": 1}, camel_killer_box="eager", box_duplicates="error")
+        updated["FooBar"] = 2
+        assert updated == {"foo_bar": 2}
+        updated.update({"BazQux": 3})
+        updated.update(**{"Other Key": 4})
+        updated.update([("ListPair", 5)])
+        assert updated == {"foo_bar": 2, "baz_qux": 3, "other_key": 4, "list_pair": 5}
+        assert (updated | {"OrKey": 6})["or_key"] == 6
+        safe = Box(conversion_box="eager")
+        safe.update({"a b": 1})
+        assert safe == {"a_b": 1}
+
+        for options in ({"conversion_box": "eager"}, {"camel_killer_box": "eager"}):
+            key = "a b" if "conversion_box" in options else "AB"
+            bx = Box({key: {"x": 1}}, **options)
+            stored = next(iter(bx))
+            assert stored != key
+            assert key in bx
+            assert bx[key] is bx[stored]
+            assert bx.get(key) is bx[stored]
+            assert bx.setdefault(key, {}) is bx[stored]
+            bx.merge_update({key: {"y": 2}})
+            assert bx == {stored: {"x": 1, "y": 2}}
+            assert "missing key" not in bx
+            assert bx.get("missing key", 5) == 5
+        with pytest.raises(BoxError):
+            Box(camel_killer_box="lazy")
+
     def test_recursive_tuples(self):
         out = _recursive_tuples(
             ({"test": "a"}, ({"second": "b"}, {"third": "c"}, ("fourth",))), dict, recreate_tuples=True
@@ -165,6 +261,11 @@ class TestBox:
         with pytest.raises(AttributeError):
             del my_box.to_json
 
+        for name in ("walk", "flatten", "set_in", "evolve", "fingerprint", "intern", "tree_version", "to_snapshot"):
+            with pytest.raises(AttributeError):
+                setattr(my_box, name, 1)
+            assert callable(getattr(my_box, name))
+
     def test_bad_args(self):
         with pytest.raises(TypeError):
             Box("123", "432")
@@ -209,6 +310,25 @@ class TestBox:
             data = json.load(f)
             assert data == test_dict
 
+    def test_to_json_without_copy(self):
+        class NoCopy(Box):
+            def to_dict(self, views=False):
+                raise AssertionError("to_json should encode the Box directly")
+
+        data = {"a": {"b": [1, {"c": "ü"}]}, "d": (2, 3)}
+        bx = NoCopy(data)
+        assert bx.to_json(sort_keys=True) == json.dumps(Box(data).to_dict(), ensure_ascii=False, sort_keys=True)
+        bx.to_json(tmp_json_file, indent=2)
+        with open(tmp_json_file, encoding="utf-8") as f:
+            assert json.load(f) == {"a": {"b": [1, {"c": "ü"}]}, "d": [2, 3]}
+        frozen = Box(data, frozen_box=True)
+        assert json.loads(frozen.to_json()) == json.loads(BoxList([frozen]).to_json())[0]
+
+        circular = BoxList([1])
+        circular.append(circular)
+        with pytest.raises(ValueError):
+            circular.to_json()
+
     def test_to_yaml_basic(self):
         a = Box(test_dict)
         yaml = YAML(typ="safe")
@@ -449,6 +569,93 @@ class TestBox:
         with pytest.raises(TypeError):
             hash(BoxList([1, 2, 3]))
 
+    def test_set_in_and_evolve(self):
+        frozen = Box({"a": {"b": {"c": 1}, "x": {"y": 2}}, "l": [{"m": 1}, [2, 3]], "k.j": 4}, frozen_box=True)
+        updated = frozen.set_in("a.b.c", 5)
+        assert updated.a.b.c == 5
+        assert frozen.a.b.c == 1
+        assert updated.a.x is frozen.a.x
+        assert updated.l is frozen.l
+        with pytest.raises(BoxError):
+            updated.a.b.c = 6
+
+        evolved = frozen.evolve({"l[0].m": {"n": 1}, ("l", 1, 0): [9], "new.deep": 1, "k.j": 7}, z=1)
+        assert evolved.l == (Box(m={"n": 1}), ((9,), 3))
+        assert evolved.l[0].m._box_config["box_namespace"] == ("l", "m")
+        assert evolved["k.j"] == 7
+        assert evolved.new.deep == 1
+        assert evolved.z == 1
+        assert evolved.a is frozen.a
+        assert frozen == {"a": {"b": {"c": 1}, "x": {"y": 2}}, "l": (Box(m=1), (2, 3)), "k.j": 4}
+
+        with pytest.raises(BoxKeyError):
+            frozen.set_in("l[5]", 1)
+        with pytest.raises(BoxKeyError):
+            frozen.set_in("missing[0]", 1)
+        with pytest.raises(TypeError):
+            frozen.set_in("a.b.c.d", 1)
+        with pytest.raises(BoxError):
+            Box(a=1).set_in("a", 2)
+
+        with_list = Box(a=BoxList([1, {"b": 2}, "shared"]), frozen_box=True)
+        changed = with_list.set_in("a[0]", {"n": 1}).set_in("a[1].b", 3)
+        assert changed.a == [{"n": 1}, {"b": 3}, "shared"]
+        assert with_list.a == [1, {"b": 2}, "shared"]
+        assert isinstance(changed.a, BoxList)
+        assert isinstance(changed.a[0], Box)
+        with pytest.raises(BoxError):
+            changed.a.append(4)
+        with pytest.raises(BoxKeyError):
+            with_list.set_in("a[3]", 1)
+
+    def test_intern(self):
+        retry = {"attempts": 3, "backoff": {"initial": 0.1}, "on": ["timeout", "reset"]}
+        data = {
+            f"svc{i}": {"host": f"h{i}", "retry": retry, "odd": {"a": 1} if i % 2 else {"a": True}} for i in range(4)
+        }
+        bx = Box(data, frozen_box=True)
+        original = Box(data, frozen_box=True)
+        report = bx.intern()
+        assert bx == original
+        assert bx.svc0.retry is bx.svc3.retry
+        assert bx.svc0.retry.on is bx.svc1.retry.on
+        assert bx.svc1.odd is bx.svc3.odd
+        assert bx.svc0.odd is not bx.svc1.odd
+        assert report["nodes"] == 3 * 3 + 2
+        assert report["bytes_saved"] > 0
+        assert bx.intern()["nodes"] == 0
+
+        with pytest.raises(BoxError):
+            Box(data).intern()
+
+    def test_hash_cache_and_fingerprint(self):
+        bx = Box(a={"b": [1, 2.5, "c"]}, d=None, frozen_box=True)
+        assert bx._box_config["__hash"] is None
+        assert hash(bx) == hash(bx)
+        assert bx._box_config["__hash"] == hash(bx)
+        loaded = pickle.loads(pickle.dumps(bx))
+        assert loaded._box_config["__hash"] is None
+        assert hash(loaded) == hash(bx)
+
+        assert bx.fingerprint() == "6c8c7d5b0307a7b27e17bb560567e5e3"
+        assert bx._box_config["__fingerprint"] is not None
+        assert Box(d=None, a={"b": [1, 2.5, "c"]}).fingerprint() == bx.fingerprint()
+        assert Box(a={"b": [1, 2.5, "c"]}, d=0, frozen_box=True).fingerprint() != bx.fingerprint()
+        assert Box(a={"b": [1.0, 2.5, "c"]}, d=None).fingerprint() != bx.fingerprint()
+        assert BoxList([1, {"x": {1, 2}}], frozen_box=True).fingerprint() == BoxList([1, {"x": {2, 1}}]).fingerprint()
+
+        merged = Box(a=1, frozen_box=True)
+        first = (hash(merged), merged.fingerprint())
+        merged.merge_update({"b": 2}, _force_unfrozen=True)
+        assert (hash(merged), merged.fingerprint()) != first
+
+        with pytest.raises(BoxError):
+            Box(a=object()).fingerprint()
+        circular = BoxList([1])
+        circular.append(circular)
+        with pytest.raises(BoxError):
+            circular.fingerprint()
+
     def test_config(self):
         bx = Box(extended_test_dict)
         assert bx["_box_config"] is True
@@ -597,6 +804,48 @@ class TestBox:
 
         bx.to_json()
 
+    def test_to_dict_shared_and_deep(self):
+        interned = Box(a={"b": 1}, c={"b": 1}, frozen_box=True)
+        interned.intern()
+        out = interned.to_dict()
+        assert type(out["a"]) is dict
+        assert out["c"] is out["a"]
+
+        circular = BoxList([1])
+        circular.append(circular)
+        circular.append(Box(a=circular))
+        out = Box(l=circular).to_dict()
+        assert out["l"][1] is out["l"]
+        assert out["l"][2]["a"] is out["l"]
+
+        deep = Box()
+        node = deep
+        for _ in range(3000):
+            node.n = {}
+            node = node.n
+        node.n = 1
+        out = deep.to_dict()
+        for _ in range(3000):
+            out = out["n"]
+        assert out == {"n": 1}
+
+        viewed = Box(a={"b": 1}, c={"d": {"e": 2}}, l=[{"f": 3}]).to_dict(views=True)
+        assert type(viewed) is dict
+        assert isinstance(viewed["a"], MappingProxyType)
+        assert type(viewed["c"]) is dict
+        assert isinstance(viewed["c"]["d"], MappingProxyType)
+        assert isinstance(viewed["l"][0], MappingProxyType)
+        with pytest.raises(TypeError):
+            viewed["a"]["b"] = 2
+
+        # Missing keys would be created through a view of a default_box Box
+        source = Box(a={"x": 1}, default_box=True)
+        copied = source.to_dict(views=True)
+        assert type(copied["a"]) is dict
+        with pytest.raises(KeyError):
+            copied["a"]["missing"]
+        assert "missing" not in source.a
+
     def test_to_multiline(self):
         a = BoxList([Box(a=1), Box(b=2), Box(three=5)])
 
@@ -686,6 +935,58 @@ class TestBox:
         assert bx == loaded2
         loaded2.box_options = bx.box_options
 
+    def test_pickle_tree(self):
+        if platform.python_implementation() == "PyPy":
+            pytest.skip("Pickling does not work correctly on PyPy")
+        bx = Box(movie_data, box_dots=True, box_dots_exclude=r"ignore\..*", camel_killer_box=True)
+        bx["shared"] = bx.movies.Spaceballs
+        dumped = pickle.dumps(bx)
+        # The config is written once for the whole tree, not once per nested Box
+        assert dumped.count(b"box_dots_exclude") == 1
+        loaded = pickle.loads(dumped)
+        assert loaded == bx
+        # Versions count changes made in this process, so a loaded Box starts over
+        assert {**loaded._box_config, "__version": 0} == {**bx._box_config, "__version": 0}
+        stars = loaded.movies.Spaceballs.Stars
+        assert stars.box_options == bx.movies.Spaceballs.Stars.box_options
+        assert {**stars[0]._box_config, "__version": 0} == {**bx.movies.Spaceballs.Stars[0]._box_config, "__version": 0}
+        assert stars[0]._box_config["box_namespace"] == ("movies", "spaceballs", "stars")
+        assert loaded["movies.spaceballs.stars[1].name"] == "John Candy"
+        assert loaded.movies.spaceballs.director == "Mel Brooks"
+        assert loaded["shared"] is not loaded.movies.Spaceballs
+
+        frozen = Box(movie_data, frozen_box=True)
+        loaded_frozen = pickle.loads(pickle.dumps(frozen))
+        assert loaded_frozen == frozen
+        assert isinstance(loaded_frozen.movies.Spaceballs.Stars, tuple)
+        assert hash(loaded_frozen) == hash(frozen)
+        with pytest.raises(BoxError):
+            loaded_frozen.new = 1
+
+        # Tuple subclasses are kept as plain values, with nodes after them still matched up
+        with_named = pickle.loads(pickle.dumps(Box(a=Point(1, 2), b={"c": (Point(3, 4), [5])}, d={"e": 6})))
+        assert type(with_named.a) is Point
+        assert with_named.a == Point(1, 2)
+        assert with_named.b.c == (Point(3, 4), [5])
+        assert with_named.d.e == 6
+
+    def test_pickle_from_7_4(self):
+        if platform.python_implementation() == "PyPy":
+            pytest.skip("Pickling does not work correctly on PyPy")
+        # Box(a={"b": 1}, l=[{"c": 2}], box_dots=True) pickled by version 7.4.1
+        with open(os.path.join(test_root, "data", "box_7_4_1.pickle"), "rb") as f:
+            loaded = pickle.load(f)
+        assert loaded == {"a": {"b": 1}, "l": [{"c": 2}]}
+        version = loaded.tree_version()
+        loaded["x"] = 1
+        del loaded["x"]
+        loaded["a.c"] = 2
+        del loaded.a["b"]
+        loaded.l[0].d = 3
+        assert loaded == {"a": {"c": 2}, "l": [{"c": 2, "d": 3}]}
+        assert loaded.changed_since(version)
+        assert loaded._box_config["box_track_changes"] is False
+
     def test_pickle_default_box(self):
         if platform.python_implementation() == "PyPy":
             pytest.skip("Pickling does not work correctly on PyPy")
@@ -754,6 +1055,107 @@ class TestBox:
         with pytest.raises(BoxError):
             Box(box_dots=False).items(dotted=True)
 
+    def test_dotted_index(self):
+        b = Box({"b": {"c": [1, {"d": 2}]}, "a": 0}, box_dots=True)
+        assert b.keys(dotted=True) == ["a", "b.c[0]", "b.c[1].d"]
+        assert b.keys(dotted=True, sort=False) == ["b.c[0]", "b.c[1].d", "a"]
+        assert b.items(dotted=True, sort=False)[1] == ("b.c[1].d", 2)
+
+        # Changes anywhere in the tree are picked up, however they are made
+        b.b.c[1].e = 3
+        b.b.c.append([4])
+        b["b.c[0]"] = 5
+        assert b.items(dotted=True) == [("a", 0), ("b.c[0]", 5), ("b.c[1].d", 2), ("b.c[1].e", 3), ("b.c[2][0]", 4)]
+        b.b.c.pop(0)
+        del b.b.c[0]["d"]
+        b.b.c.reverse()
+        assert b.keys(dotted=True) == ["a", "b.c[0][0]", "b.c[1].e"]
+        b.b.c[0] += [6]
+        b.b.c[1].clear()
+        b.update(a={"f": 7})
+        assert b.keys(dotted=True) == ["a.f", "b.c[0][0]", "b.c[0][1]", "b.c[1]"]
+        keys = b.keys(dotted=True)
+        keys.append("not in box")
+        assert "not in box" not in b.keys(dotted=True)
+
+    def test_walk(self):
+        b = Box(a={"b": [1, {"c": 2}, []]}, d=3)
+        assert [path for path, _ in b.walk()] == [
+            ("a",),
+            ("a", "b"),
+            ("a", "b", 0),
+            ("a", "b", 1),
+            ("a", "b", 1, "c"),
+            ("a", "b", 2),
+            ("d",),
+        ]
+        assert [path for path, _ in b.walk(order="post", dotted=True)] == [
+            "a.b[0]",
+            "a.b[1].c",
+            "a.b[1]",
+            "a.b[2]",
+            "a.b",
+            "a",
+            "d",
+        ]
+        assert list(b.walk(leaves_only=True, dotted=True)) == [("a.b[0]", 1), ("a.b[1].c", 2), ("a.b[2]", []), ("d", 3)]
+        assert list(b.walk(max_depth=1, leaves_only=True)) == [(("a",), b.a), (("d",), 3)]
+        frozen = Box({"a": [1, {"b": 2}], "p": Point(3, 4)}, frozen_box=True)
+        assert list(frozen.walk(leaves_only=True, dotted=True)) == [("a[0]", 1), ("a[1].b", 2), ("p", Point(3, 4))]
+        with pytest.raises(BoxError):
+            b.walk(order="in")
+        with pytest.raises(BoxError):
+            b.walk(max_depth=0)
+
+        deep = Box()
+        node = deep
+        for _ in range(5000):
+            node["n"] = {}
+            node = node.n
+        node.n = "bottom"
+        path, value = next(deep.walk(leaves_only=True))
+        assert len(path) == 5001
+        assert value == "bottom"
+
+    def test_flatten(self):
+        b = Box(a={"b": [1, {"c": 2}, [], [[3]]]}, d=3, e={}, box_dots=True)
+        flat = b.flatten()
+        assert flat == {"a.b[0]": 1, "a.b[1].c": 2, "a.b[2]": [], "a.b[3][0][0]": 3, "d": 3, "e": {}}
+        assert all(b[path] == value for path, value in flat.items())
+        assert b.flatten(sep="__", list_style="i")["a__b__3__0__0"] == 3
+        with pytest.raises(BoxError):
+            b.flatten(list_style="(i)")
+
+        rebuilt = Box.unflatten(flat, box_dots=True)
+        assert rebuilt == b
+        assert isinstance(rebuilt.a.b[1], Box)
+        assert isinstance(rebuilt.a.b[3][0], BoxList)
+        assert rebuilt.a.b[1]._box_config["box_dots"] is True
+        assert rebuilt.a.b.box_options["box_namespace"] == ("a", "b")
+        rebuilt.a.b[1].d = 4
+        assert rebuilt["a.b[1].d"] == 4
+        assert Box.unflatten(b.flatten(sep="__", list_style="i"), sep="__", list_style="i") == b
+        assert Box.unflatten({"a__b.c": {"d": 1}}, sep="__", box_dots=True).a["b.c"].d == 1
+
+        frozen = Box.unflatten(flat, frozen_box=True)
+        assert frozen.a.b[3] == ((3,),)
+        assert frozen.flatten() == flat
+        assert Box.unflatten(frozen.flatten(), frozen_box=True) == frozen
+        with pytest.raises(BoxError):
+            frozen.d = 4
+        assert Box.unflatten({"CamelCase.Inner": 1}, camel_killer_box=True).camel_case.inner == 1
+
+        with pytest.raises(BoxError):
+            Box.unflatten({"a": 1, "a.b": 2})
+        with pytest.raises(BoxError):
+            Box.unflatten({"a": None, "a.b": 1})
+        with pytest.raises(BoxError):
+            Box.unflatten({"a[0]": None, "a[0].b": 1})
+        assert Box.unflatten({"a[2]": 1, "a[0]": None}).a == [None, None, 1]
+        assert Box.unflatten({"a[1].b": 1}, box_dots=True).a == [None, {"b": 1}]
+        with pytest.raises(BoxError):
+            Box.unflatten({"a.b": 1, "a[0]": 2})
+
     def test_get(self):
         bx = Box()
         bx["c"] = {}
@@ -771,6 +1173,13 @@ class TestBox:
         assert "a.b.c" in bx_dot
         assert "a.b.c.d" not in bx_dot
 
+        bx_list = Box(a=[{"b": 1}, [2, {"c": 3}]], d="xbcx", box_dots=True)
+        assert "a[0]" in bx_list
+        assert "a[1][1].c" in bx_list
+        assert "a[1][2]" not in bx_list
+        assert "a[0].c" not in bx_list
+        assert "d.bc" not in bx_list
+
     def test_get_default_box(self):
         bx = Box(default_box=True)
         assert bx.get("test", 4) == 4
@@ -868,6 +1277,20 @@ class TestBox:
         with pytest.raises(BoxKeyError):
             bx["_box_config"]
 
+    def test_getattr_sources(self):
+        class UpperBox(Box):
+            def __getitem__(self, item, _ignore_default=False):
+                return super().__getitem__(item.upper(), _ignore_default)
+
+        assert UpperBox(KEY=1).key == 1
+        bx = Box({"a key": 1, "CamelCase": 2}, camel_killer_box=True)
+        assert bx.camel_case == 2
+        assert bx.CamelCase == 2
+        assert bx.a_key == 1
+        assert bx.__getattr__("keys")() == bx.keys()
+        with pytest.raises(BoxKeyError, match="'Box' object has no attribute 'missing'"):
+            bx.missing
+
     def test_pop(self):
         bx = Box(a=4, c={"d": 3}, sub_box=Box(test=1))
         assert bx.pop("a") == 4
@@ -1128,6 +1551,33 @@ class TestBox:
         with pytest.raises(BoxError):
             d.keys(dotted=True)
 
+    def test_compile_path(self):
+        b = Box({"a": {"b": [{"c": 1}, {"c": 2}]}, "x": "y"}, box_dots=True)
+        dict.__setitem__(b, "a.b.c", "literal")
+        path = Box.compile_path("a.b[1].c")
+        assert path.segments == ("a", "b", 1, "c")
+        assert path(b) == 2
+        assert path is Box.compile_path("a.b[1].c")
+        assert Box.compile_path("a.b[5].c").get(b, "missing") == "missing"
+        assert Box.compile_path("x.y").get(b) is None
+        assert Box.compile_path("[0].c")(b.a.b) == 1
+        assert Box.compile_path("a.b[0].c")(b.to_dict()) == 1
+        with pytest.raises(BoxError):
+            Box.compile_path("a..b")
+        with pytest.raises(BoxError):
+            Box.compile_path("a[x]")
+
+        # Keys containing dots are still preferred over splitting them, as without compiled paths
+        assert b["a.b.c"] == "literal"
+        assert "a.b.c" in b
+        assert b["a.b[0].c"] == 1
+        assert "a.b[1].c" in b
+        assert "a.b[2].c" not in b
+        b["a.b[1].c"] = 3
+        assert b.a.b[1].c == 3
+        b["a.d"] = 4
+        assert b.a.d == 4
+
     def test_toml(self):
         b = Box.from_toml(filename=Path(test_root, "data", "toml_file.tml"), default_box=True)
         assert b.database.server == "192.168.1.1"
@@ -1364,6 +1814,12 @@ class TestBox:
         assert isinstance(box["f"], BoxList)
         assert box.f[1] == 2
 
+        box.f.append({"g": 5})
+        assert box.setdefault("f[2].g", 6) == 5
+        assert box.setdefault("f[1]", 6) == 2
+        assert box.setdefault("f[2].h", 7) == 7
+        assert box.f[2].h == 7
+
     def test_setdefault_dots_default(self):
         box = Box({"a": 1}, box_dots=True, default_box=True)
         box.b.c.d.setdefault("e", 2)
@@ -1457,6 +1913,34 @@ class TestBox:
         del box.field
         assert not "_field" in box
 
+    def test_class_attribute_cache(self):
+        class ReadOnly(Box):
+            _protected_keys = Box._protected_keys + ["locked"]
+
+            @property
+            def size(self):
+                return len(self)
+
+        class Overridden(ReadOnly):
+            size = 0
+
+        assert ReadOnly._protected_names >= {"locked", "to_dict", "keys"}
+        assert set(ReadOnly._properties) == {"size"}
+        assert Overridden._properties == {}
+
+        bx = ReadOnly(a=1)
+        with pytest.raises(BoxKeyError):
+            bx.locked = True
+        with pytest.raises(BoxKeyError):
+            del bx.locked
+        # A property without a setter is shadowed by the key, as before
+        bx.size = 5
+        assert bx["size"] == 5
+        bx.other = 1
+        assert bx["other"] == 1
+        with pytest.raises(BoxKeyError):
+            bx.walk = 1
+
     def test_box_namespace(self):
         bx = Box(default_box=True)
         assert bx._box_config["box_namespace"] == ()
@@ -1506,3 +1990,86 @@ class TestBox:
         my_box = DDBox(default_box_attr=func)
 
         assert my_box.a == {"bi": "{}", "key": "a"}
+
+        def keyword_only(*, key, box_instance=None):
+            return key.upper()
+
+        kw_box = Box(default_box=True, default_box_attr=keyword_only)
+        assert kw_box.a == "A"
+        assert kw_box.b == "B"
+        assert _default_box_attr_conventions[keyword_only] == ((), ("key", "box_instance"))
+
+        class Factory:
+            def make(self, key):
+                return key * 2
+
+        factory = Factory()
+        factory_ref = weakref.ref(factory)
+        method_box = Box(default_box=True, default_box_attr=factory.make)
+        assert method_box.ab == "abab"
+        # The remembered calling convention does not keep the factory alive
+        del method_box, factory
+        gc.collect()
+        assert factory_ref() is None
+
+        def bad(key, other):
+            pass
+
+        with pytest.raises(BoxError):
+            Box(default_box=True, default_box_attr=bad).a
+
+    def test_changed_since(self):
+        for track in (True, False):
+            bx = Box(a={"b": {"c": 1}}, l=[{"d": 2}], box_track_changes=track)
+            version = bx.tree_version()
+            assert not bx.changed_since(version)
+            bx.a.b.c = 2
+            assert bx.changed_since(version)
+            version = bx.tree_version()
+            del bx.a.b.c
+            assert bx.changed_since(version)
+            version = bx.tree_version()
+            bx.l[0].update(e=3)
+            assert bx.changed_since(version)
+            version = bx.tree_version()
+            bx.l.append({"f": 4})
+            bx.l[1].f = 5
+            assert bx.changed_since(version)
+            version = bx.tree_version()
+            bx.a.merge_update({"b": {"g": 6}})
+            assert bx.changed_since(version)
+            assert bx.a.b.g == 6
+            version = bx.tree_version()
+            assert bx.a.tree_version() <= version
+            assert not bx.changed_since(version)
+
+        tracked = Box(a={"b": {"c": 1}}, box_track_changes=True)
+        assert [ref() for ref in tracked.a.b._box_config["__parent"]] == [tracked.a]
+        assert Box(a={"b": 1})._box_config["__parent"] is None
+
+        if platform.python_implementation() != "PyPy":
+            loaded = pickle.loads(pickle.dumps(tracked))
+            version = loaded.tree_version()
+            loaded.a.b.c = 2
+            assert loaded.changed_since(version)
+
+        # Nodes stored in more than one place pass changes to all of them
+        copied = Box(a={"lst": [1]}, box_track_changes=True)
+        version = copied.tree_version()
+        other = copied.copy()
+        other_version = other.tree_version()
+        copied.a.lst.append(2)
+        assert copied.changed_since(version)
+        other.a.lst.append(3)
+        assert other.changed_since(other_version)
+
+        first = Box(box_track_changes=True)
+        second = Box(box_track_changes=True)
+        shared = BoxList([1], box_track_changes=True)
+        first.lst = shared
+        second.lst = shared
+        assert first.lst is second.lst
+        versions = first.tree_version(), second.tree_version()
+        shared.append(2)
+        assert first.changed_since(versions[0])
+        assert second.changed_since(versions[1])
@@ -4,6 +4,7 @@
 
 import json
 import os
+import pickle
 import shutil
 import sys
 import platform
@@ -68,6 +69,16 @@ class TestBoxList:
             del bl[0]
         with pytest.raises(BoxError):
             bl[0] = 5
+        with pytest.raises(BoxError):
+            bl.insert(0, 1)
+        with pytest.raises(BoxError):
+            bl.clear()
+        with pytest.raises(BoxError):
+            bl += [1]
+        with pytest.raises(BoxError):
+            bl *= 2
+        assert bl == [5, 4, 3]
+        assert "append" not in bl.__dict__
         bl2 = BoxList([5, 4, 3])
         del bl2[0]
         assert bl2[0] == 4
@@ -274,3 +285,24 @@ class TestBoxList:
         circular_list.append(circular_list)
         circular_box = BoxList(circular_list)
         assert circular_box[0] == circular_box
+
+    def test_pickle_tree(self):
+        if platform.python_implementation() == "PyPy":
+            pytest.skip("Pickling does not work correctly on PyPy")
+        circular_box = BoxList([{"a": 1}, [{"b": 2}]], box_dots=True)
+        circular_box.append(circular_box)
+        loaded = pickle.loads(pickle.dumps(circular_box))
+        assert loaded[2] is loaded
+        assert loaded["[1][0].b"] == 2
+        assert {**loaded[0]._box_config, "__version": 0} == {**circular_box[0]._box_config, "__version": 0}
+
+        frozen = pickle.loads(pickle.dumps(BoxList([5, 4, 3], frozen_box=True)))
+        assert frozen == [5, 4, 3]
+        with pytest.raises(BoxError):
+            frozen.append(2)
+
+    def test_walk(self):
+        bl = BoxList([[1], {"a": 2}])
+        bl.append(bl)
+        assert list(bl.walk(dotted=True)) == [("[0]", bl[0]), ("[0][0]", 1), ("[1]", bl[1]), ("[1].a", 2), ("[2]", bl)]
+        assert [path for path, _ in bl.walk(order="post", leaves_only=True)] == [(0, 0), (1, "a"), (2,)]
@@ -47,3 +47,88 @@ class TestFromFile:
 
         with open(Path(test_root, "data", "yaml_file.yaml"), "r") as f:
             box_from_string(f.read(), string_type="yaml")
+
+    @pytest.mark.parametrize(
+        "data_file, box_type",
+        [
+            ("json_file.json", Box),
+            ("json_list.json", BoxList),
+            ("toml_file.tml", Box),
+            ("yaml_file.yaml", Box),
+            ("yaml_list.yaml", BoxList),
+            ("msgpack_file.msgpack", Box),
+            ("msgpack_list.msgpack", BoxList),
+            ("csv_file.csv", BoxList),
+        ],
+    )
+    def test_from_file_sniffed(self, tmp_path, data_file, box_type):
+        original = box_from_file(Path(test_root, "data", data_file))
+        for name in ("data", "data.txt"):
+            sniffed_file = Path(tmp_path, name)
+            sniffed_file.write_bytes(Path(test_root, "data", data_file).read_bytes())
+            sniffed = box_from_file(sniffed_file)
+            assert isinstance(sniffed, box_type)
+            assert sniffed == original
+        assert box_from_file(Path(test_root, "data", data_file), file_type="auto") == original
+
+    def test_from_file_sniffed_details(self, tmp_path):
+        bom_file = Path(tmp_path, "bom")
+        bom_file.write_bytes(b'\xef\xbb\xbf{"a": 1}')
+        assert box_from_file(bom_file) == {"a": 1}
+
+        utf16_file = Path(tmp_path, "utf16")
+        utf16_file.write_text('[{"a": 1}]', encoding="utf-16")
+        assert box_from_file(utf16_file) == [{"a": 1}]
+
+        semicolon_file = Path(tmp_path, "semicolon")
+        semicolon_file.write_text("Number;Name\n1;Chris\n2;Sam\n")
+        assert box_from_file(semicolon_file) == [{"Number": "1", "Name": "Chris"}, {"Number": "2", "Name": "Sam"}]
+
+        yaml_file = Path(tmp_path, "yaml")
+        yaml_file.write_text("---\n- a\n- b\n")
+        assert box_from_file(yaml_file) == ["a", "b"]
+
+        toml_file = Path(tmp_path, "toml")
+        toml_file.write_text('[table]\nkey = "value"\n')
+        assert box_from_file(toml_file) == {"table": {"key": "value"}}
+
+        toml_colon_file = Path(tmp_path, "toml_colon")
+        toml_colon_file.write_text('title = "Note: x"\nowner = "me"\n')
+        assert box_from_file(toml_colon_file) == {"title": "Note: x", "owner": "me"}
+
+        yaml_equals_file = Path(tmp_path, "yaml_equals")
+        yaml_equals_file.write_text("query: a=b\nother: c\n")
+        assert box_from_file(yaml_equals_file) == {"query": "a=b", "other": "c"}
+
+        empty_file = Path(tmp_path, "empty")
+        empty_file.write_text("\n# only a comment\n")
+        with pytest.raises(BoxError):
+            box_from_file(empty_file)
+
+    def test_from_file_select(self, tmp_path):
+        json_file = Path(test_root, "data", "json_file.json")
+        full = box_from_file(json_file)
+
+        window = box_from_file(json_file, select="widget.window")
+        assert isinstance(window, Box)
+        assert window == full.widget.window
+        assert box_from_file(json_file, select="widget.window", default_box=True).missing == Box()
+
+        items_file = Path(tmp_path, "items.json")
+        items_file.write_text(
+            '{"skip": {"deep": [1, {"a": "]}\\""}]}, "payload": {"items": [{"id": 1, "x": [1]}, {"id": 2}], "n": 2}}'
+        )
+        assert box_from_file(items_file, select="payload.items[*].id") == [1, 2]
+        assert box_from_file(items_file, select="payload.items[1]") == {"id": 2}
+        assert isinstance(box_from_file(items_file, select="payload.items"), BoxList)
+        assert box_from_file(items_file, select="skip.deep[*].a") == [']}"']
+        assert box_from_file(items_file, select="missing[*]") == []
+        with pytest.raises(BoxError):
+            box_from_file(items_file, select="payload.missing")
+        with pytest.raises(BoxError):
+            box_from_file(items_file, select="payload.n")
+        for bad_select in ("payload..items", "payload.", ".payload", "payload[x]", "payload[]", ""):
+            with pytest.raises(BoxError, match="Invalid select path"):
+                box_from_file(items_file, select=bad_select)
+        with pytest.raises(BoxError):
+            box_from_file(Path(test_root, "data", "yaml_file.yaml"), select="invoice")
@@ -26,3 +26,26 @@ class TestSBox:
         assert not isinstance(pbox.dict, Box)
         assert pbox.dict["inner"]["camel_case"] == "Item"
         assert pbox.toml.startswith('key1 = "value1"')
+
+    def test_cached_forms(self):
+        sbox = SBox(a={"b": [1, {"c": 2}]})
+        first = sbox.json
+        assert sbox.json is first
+        Box(unrelated=1)["x"] = 2
+        assert sbox.json is first
+        sbox.a.b[1].c = 3
+        assert json.loads(sbox.json) == {"a": {"b": [1, {"c": 3}]}}
+        sbox.a.b.append(4)
+        assert json.loads(sbox.json)["a"]["b"][-1] == 4
+        del sbox.a.b[0]
+        assert json.loads(sbox.json)["a"]["b"][0] == {"c": 3}
+        sbox.a = {"d": 1}
+        assert json.loads(sbox.json) == {"a": {"d": 1}}
+
+        copied = sbox.dict
+        copied["a"]["d"] = 2
+        assert sbox.dict == {"a": {"d": 1}}
+
+        frozen = SBox(a={"b": 1}, frozen_box=True)
+        assert frozen.json is frozen.json
+        assert frozen.yaml is frozen.yaml
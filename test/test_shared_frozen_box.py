@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+from test.common import movie_data, test_root
+
+import pytest
+
+from box import Box, BoxError, SharedFrozenBox
+
+
+def mp_shared_test(q, shared):
+    try:
+        assert isinstance(shared, SharedFrozenBox)
+        assert shared.movies.Spaceballs.Stars[1].name == "John Candy"
+        assert shared["movies.Spaceballs.rating"] == "PG"
+    except AssertionError:
+        q.put(False)
+    else:
+        q.put(True)
+
+
+class TestSharedFrozenBox:
+    def test_shared_frozen_box(self):
+        shared = SharedFrozenBox(Box(movie_data, frozen_box=True), box_dots=True)
+        try:
+            assert shared == movie_data
+            assert shared.movies.Spaceballs.length == 96
+            assert shared["movies.Spaceballs.Stars[2].role"] == "Dark Helmet"
+            assert "movies.Spaceballs.Stars[9]" not in shared
+            assert shared.get("movies.Spaceballs.Stars[0].name.first", 5) == 5
+            attached = SharedFrozenBox.attach(shared.segment_name, box_dots=True)
+            assert attached.to_dict() == movie_data
+            assert pickle.loads(pickle.dumps(shared)).segment_name == shared.segment_name
+            with pytest.raises(BoxError):
+                shared.movies = 1
+            with SharedFrozenBox.attach(shared.segment_name) as attached_again:
+                assert attached_again.movies.Spaceballs.length == 96
+            named = SharedFrozenBox({"name": "svc", "close": 1, "unlink": 2})
+            try:
+                assert (named.name, named.close, named.unlink) == ("svc", 1, 2)
+            finally:
+                named.segment_unlink()
+        finally:
+            shared.segment_unlink()
+
+    def test_shared_frozen_box_bad_data(self):
+        with pytest.raises(BoxError):
+            SharedFrozenBox([1, 2, 3])  # type: ignore[arg-type]
+
+    def test_shared_frozen_box_process(self):
+        shared = SharedFrozenBox(movie_data, box_dots=True)
+        try:
+            ctx = multiprocessing.get_context("spawn")
+            q = ctx.Queue()
+            p = ctx.Process(target=mp_shared_test, args=(q, shared))
+            p.start()
+            p.join()
+            assert q.get(timeout=2)
+        finally:
+            shared.segment_unlink()
+
+    def test_shared_frozen_box_independent_processes(self):
+        shared = SharedFrozenBox(movie_data)
+        try:
+            # Processes not started from this one, each exiting must leave the segment in place
+            script = (
+                "from box import SharedFrozenBox; "
+                f"print(SharedFrozenBox.attach({shared.segment_name!r}).movies.Spaceballs.length)"
+            )
+            for _ in range(2):
+                result = subprocess.run(
+                    [sys.executable, "-c", script],
+                    cwd=os.path.dirname(test_root),
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                assert result.stdout.strip() == "96"
+                assert result.stderr == ""
+        finally:
+            shared.segment_unlink()
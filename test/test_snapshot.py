@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import pickle
+from pathlib import Path
+from test.common import movie_data, test_dict
+
+import pytest
+
+from box import Box, BoxError, BoxKeyError, BoxList
+from box.snapshot import SnapshotBox, SnapshotBoxList
+
+
+class TestSnapshot:
+    def test_snapshot_round_trip(self, tmp_path):
+        snapshot_file = Path(tmp_path, "movies.snap")
+        bx = Box(movie_data)
+        bx.to_snapshot(snapshot_file)
+        snapshot = Box.open_snapshot(snapshot_file)
+        assert isinstance(snapshot, SnapshotBox)
+        assert snapshot == bx
+        assert snapshot.to_dict() == bx.to_dict()
+        assert isinstance(snapshot.to_box(), Box)
+        assert list(snapshot.movies) == list(bx.movies)
+        stars = snapshot.movies.Spaceballs.Stars
+        assert isinstance(stars, SnapshotBoxList)
+        assert stars[-1].name == "Rick Moranis"
+        assert stars[0:2] == bx.movies.Spaceballs.Stars[0:2]
+        assert isinstance(stars.to_box_list(), BoxList)
+        with pytest.raises(IndexError):
+            stars[10]
+
+    def test_snapshot_keys(self, tmp_path):
+        snapshot_file = Path(tmp_path, "keys.snap")
+        data = dict(test_dict)
+        data.update({3: "int", (1, 2): "tuple", "a.b": "dotted", "a": {"b": {"c": [1, {"d": 4}]}}})
+        Box(data).to_snapshot(snapshot_file)
+        snapshot = Box.open_snapshot(snapshot_file, box_dots=True)
+        assert snapshot[3] == "int"
+        assert snapshot[(1, 2)] == "tuple"
+        assert snapshot["a.b"] == "dotted"
+        assert snapshot["a.b.c[1].d"] == 4
+        assert "a.b.c[0]" in snapshot
+        assert "missing" not in snapshot
+        assert snapshot.get("missing", 5) == 5
+        assert "a.b.c[9]" not in snapshot
+        assert snapshot.get("a.b.c[9]", 5) == 5
+        assert "a.b.c[0].x" not in snapshot
+        assert "a.b.c[1].x" not in snapshot
+        with pytest.raises(BoxKeyError):
+            snapshot["a.b.c[9].d"]
+        assert snapshot["Key 2"]["Key4"].Key5 == "Value5"
+        with pytest.raises(BoxKeyError):
+            snapshot.missing
+        with pytest.raises(BoxKeyError):
+            Box.open_snapshot(snapshot_file)["a.b.c[1].d"]
+
+    def test_snapshot_read_only(self, tmp_path):
+        snapshot_file = Path(tmp_path, "read_only.snap")
+        Box(a=1).to_snapshot(snapshot_file)
+        snapshot = Box.open_snapshot(snapshot_file)
+        with pytest.raises(BoxError):
+            snapshot.a = 2
+        with pytest.raises(TypeError):
+            snapshot["a"] = 2
+        with pytest.raises(TypeError):
+            pickle.dumps(snapshot)
+
+    def test_snapshot_context_manager(self, tmp_path):
+        snapshot_file = Path(tmp_path, "closed.snap")
+        Box(close=1, a={"b": 2}).to_snapshot(snapshot_file)
+        with Box.open_snapshot(snapshot_file) as snapshot:
+            assert snapshot.close == 1
+            nested = snapshot.a
+            assert nested.b == 2
+        with pytest.raises(ValueError):
+            nested.b
+
+    def test_snapshot_bad_data(self, tmp_path):
+        bad_file = Path(tmp_path, "bad.snap")
+        bad_file.write_bytes(b"not a snapshot at all")
+        with pytest.raises(BoxError):
+            Box.open_snapshot(bad_file)
+        bad_file.write_bytes(b"")
+        with pytest.raises(BoxError):
+            Box.open_snapshot(bad_file)
+        good_file = Path(tmp_path, "good.snap")
+        Box(movie_data).to_snapshot(good_file)
+        for size in (4, 20, len(good_file.read_bytes()) // 2):
+            bad_file.write_bytes(good_file.read_bytes()[:size])
+            with pytest.raises(BoxError):
+                Box.open_snapshot(bad_file)
+
+        recursive = BoxList([1])
+        recursive.append(recursive)
+        bx = Box(a=recursive)
+        assert bx.a[1] is bx.a
+        with pytest.raises(BoxError):
+            bx.to_snapshot(Path(tmp_path, "recursive.snap"))